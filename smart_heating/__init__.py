@@ -241,13 +241,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await asyncio.sleep(5)  # Wait for HA to be fully started
         try:
             areas = area_manager.get_all_areas()
-            for area in areas.values():
-                for device_id in area.get_thermostats():
-                    try:
-                        await device_capability_detector.discover_and_cache(device_id)
-                        _LOGGER.debug("Discovered capabilities for %s", device_id)
-                    except (HomeAssistantError, DeviceError, AttributeError) as err:
-                        _LOGGER.debug("Could not discover capabilities for %s: %s", device_id, err)
+            device_ids = [
+                device_id for area in areas.values() for device_id in area.get_thermostats()
+            ]
+            try:
+                profiles = await device_capability_detector.discover_and_cache_batch(device_ids)
+                _LOGGER.debug("Discovered capabilities for %d devices", len(profiles))
+            except (HomeAssistantError, DeviceError, AttributeError) as err:
+                _LOGGER.debug("Could not discover device capabilities: %s", err)
             _LOGGER.info("Device capability discovery complete")
         except (HomeAssistantError, SmartHeatingError, RuntimeError) as err:
             _LOGGER.error("Error during device discovery: %s", err, exc_info=True)
@@ -744,6 +745,11 @@ async def _shutdown_components(hass: HomeAssistant, entry: ConfigEntry) -> None:
         await call_maybe_async(hass.data[DOMAIN]["history"].async_unload)
         _LOGGER.debug("History tracker unloaded")
 
+    # Close event store, writing any buffered events
+    if "event_store" in hass.data[DOMAIN]:
+        await call_maybe_async(hass.data[DOMAIN]["event_store"].async_close)
+        _LOGGER.debug("Event store closed")
+
 
 async def _cleanup_tasks(hass: HomeAssistant) -> None:
     """Cancel background tasks and cleanup.
@@ -5,6 +5,7 @@ import asyncio
 from aiohttp import web
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers.json import json_dumps
 
 from ...core.area_manager import AreaManager
 from ...models import Area
@@ -34,7 +35,7 @@ async def handle_get_areas(hass: HomeAssistant, area_manager: AreaManager) -> we
         _build_area_data_for_registry(hass, area_manager, area)
         for area in area_registry.areas.values()
     ]
-    return web.json_response({"areas": areas_data})
+    return web.json_response({"areas": areas_data}, dumps=json_dumps)
 
 
 def _build_area_data_for_registry(hass: HomeAssistant, area_manager: AreaManager, area) -> dict:
@@ -115,4 +116,4 @@ async def handle_get_area(
     # Use a small await to satisfy async checks; the handler remains non-blocking
     await asyncio.sleep(0)
 
-    return web.json_response(area_data)
+    return web.json_response(area_data, dumps=json_dumps)
@@ -1,7 +1,6 @@
 """Area-specific logging for Smart Heating development."""
 
 import asyncio
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -9,6 +8,8 @@ from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util.json import json_loads
 
 from .exceptions import StorageError
 
@@ -126,7 +127,7 @@ class AreaLogger:
         def _write():
             try:
                 with open(log_file, "a", encoding="utf-8") as f:
-                    f.write(json.dumps(entry) + "\n")
+                    f.write(json_dumps(entry) + "\n")
             except (HomeAssistantError, StorageError, OSError, asyncio.TimeoutError) as err:
                 _LOGGER.error("Failed to write log for area %s: %s", area_id, err)
 
@@ -221,8 +222,8 @@ class AreaLogger:
                 with open(log_file, "r", encoding="utf-8") as f:
                     for line in f:
                         try:
-                            logs.append(json.loads(line.strip()))
-                        except json.JSONDecodeError:
+                            logs.append(json_loads(line.strip()))
+                        except ValueError:
                             continue
             except (HomeAssistantError, StorageError, OSError, asyncio.TimeoutError) as err:
                 _LOGGER.error("Failed to read log file %s: %s", log_file, err)
@@ -217,8 +217,6 @@ class ClimateController:
         Returns:
             Tuple(list of heating area ids, max target temperature)
         """
-        await self._record_area_history(area_id, area, should_record_history, history_tracker)
-
         if await self._handle_disabled_area(area_id, area, history_tracker, should_record_history):
             return None, None
 
@@ -344,13 +342,21 @@ class ClimateController:
             return True
         return False
 
-    async def _record_area_history(self, area_id, area, should_record_history, history_tracker):
-        """Record history if enabled and available."""
-        if should_record_history and history_tracker and area.current_temperature is not None:
-            trvs = self._collect_trv_states(area)
-            await history_tracker.async_record_temperature(
-                area_id, area.current_temperature, area.target_temperature, area.state, trvs
-            )
+    async def _record_history(self, areas: dict, history_tracker) -> None:
+        """Record one history reading per area with a known temperature, as one batch."""
+        await history_tracker.async_record_temperatures(
+            [
+                (
+                    area_id,
+                    area.current_temperature,
+                    area.target_temperature,
+                    area.state,
+                    self._collect_trv_states(area),
+                )
+                for area_id, area in areas.items()
+                if area.current_temperature is not None
+            ]
+        )
 
     def _collect_trv_states(self, area) -> list[dict]:
         """Collect TRV states for an area's configured TRV entities.
@@ -679,8 +685,14 @@ class ClimateController:
         heating_areas = []
         max_target_temp = 0.0
 
+        areas = self.area_manager.get_all_areas()
+
+        # Record every area's reading before it is processed, in one batch
+        if should_record_history and history_tracker:
+            await self._record_history(areas, history_tracker)
+
         # Control each area
-        for area_id, area in self.area_manager.get_all_areas().items():
+        for area_id, area in areas.items():
             area_heating, area_max_temp = await self._process_area(
                 area_id,
                 area,
@@ -693,11 +705,7 @@ class ClimateController:
             if area_max_temp is not None:
                 max_target_temp = max(max_target_temp, area_max_temp)
 
-        # Control OpenTherm gateway
+        # Control OpenTherm gateway; recorded history schedules its own save
         await self.device_handler.async_control_opentherm_gateway(
             len(heating_areas) > 0, max_target_temp
         )
-
-        # Save history periodically
-        if should_record_history and history_tracker:
-            await history_tracker.async_save()
@@ -2,10 +2,12 @@
 
 import asyncio
 import logging
+import sys
+from datetime import datetime
 from typing import Optional
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
@@ -24,6 +26,9 @@ _LOGGER = logging.getLogger(__name__)
 # Debounce delay for manual temperature changes (in seconds)
 MANUAL_TEMP_CHANGE_DEBOUNCE = 2.0
 
+# Maximum number of weather entities kept in the parsed weather cache
+WEATHER_CACHE_MAX_SIZE = 32
+
 
 class SmartHeatingCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Smart Heating data."""
@@ -42,10 +47,20 @@ class SmartHeatingCoordinator(DataUpdateCoordinator):
             name=DOMAIN,
             update_interval=UPDATE_INTERVAL,
             config_entry=entry,
+            # Only notify listeners when the refreshed data actually differs
+            always_update=False,
         )
         self.area_manager = area_manager
         self._unsub_state_listener = None
         self._refresh_tasks = set()  # Track outstanding refresh tasks
+        # Parsed (open, position) per TRV entity, kept current by state change events
+        self._trv_values: dict[str, tuple[bool | None, float | None]] = {}
+        self._tracked_trv_entities: frozenset[str] = frozenset()
+        self._unsub_trv_listener = None
+        # Last area payloads, reused when a refresh produces identical data
+        self._last_area_data: dict[str, dict] = {}
+        # Parsed weather data keyed by entity ID, valid while last_updated matches
+        self._weather_cache: dict[str, tuple[datetime, dict | None]] = {}
 
         # Create coordination components
         self._state_builder = StateBuilder(hass, self)
@@ -237,6 +252,7 @@ class SmartHeatingCoordinator(DataUpdateCoordinator):
         if self._unsub_state_listener:
             self._unsub_state_listener()
             self._unsub_state_listener = None
+        self._untrack_trv_entities()
         # Cancel tasks and clear them using helpers
         self._cancel_task_if_exists("_grace_period_task")
         self._debouncer.cancel_all()
@@ -375,6 +391,10 @@ class SmartHeatingCoordinator(DataUpdateCoordinator):
     def _get_weather_state_data(self, weather_entity_id: str) -> dict | None:
         """Get weather state data for an area.
 
+        Parsed data is cached per entity and reused while the state's
+        last_updated timestamp is unchanged, so areas sharing a weather
+        entity parse it once per update.
+
         Args:
             weather_entity_id: Weather entity ID
 
@@ -385,7 +405,31 @@ class SmartHeatingCoordinator(DataUpdateCoordinator):
             return None
 
         state = self.hass.states.get(weather_entity_id)
-        if not state or state.state in ("unavailable", "unknown"):
+        if not state:
+            return None
+
+        cached = self._weather_cache.get(weather_entity_id)
+        if cached is not None and cached[0] == state.last_updated:
+            return cached[1]
+
+        weather_data = self._parse_weather_state(weather_entity_id, state)
+        if len(self._weather_cache) >= WEATHER_CACHE_MAX_SIZE:
+            self._weather_cache.clear()
+        self._weather_cache[weather_entity_id] = (state.last_updated, weather_data)
+        return weather_data
+
+    @staticmethod
+    def _parse_weather_state(weather_entity_id: str, state: State) -> dict | None:
+        """Parse a weather entity state into weather state data.
+
+        Args:
+            weather_entity_id: Weather entity ID
+            state: Weather entity state
+
+        Returns:
+            Weather state data dictionary or None
+        """
+        if state.state in ("unavailable", "unknown"):
             return None
 
         try:
@@ -412,6 +456,76 @@ class SmartHeatingCoordinator(DataUpdateCoordinator):
         """
         return self._state_builder.build_area_data(area_id, area)
 
+    def _track_trv_entities(self, areas: dict[str, Area]) -> None:
+        """Keep the TRV value store subscribed to the TRVs configured across areas.
+
+        The listener is only replaced when the set of TRV entities changes;
+        newly tracked entities are seeded from their current state.
+
+        Args:
+            areas: Areas being refreshed
+        """
+        entity_ids = frozenset(
+            sys.intern(trv["entity_id"])
+            for area in areas.values()
+            for trv in getattr(area, "trv_entities", [])
+            if trv.get("entity_id")
+        )
+        if entity_ids == self._tracked_trv_entities:
+            return
+
+        self._untrack_trv_entities()
+        self._tracked_trv_entities = entity_ids
+        if not entity_ids:
+            return
+
+        get_state = self.hass.states.get
+        for entity_id in entity_ids:
+            self._trv_values[entity_id] = self._extract_trv_values(entity_id, get_state(entity_id))
+        self._unsub_trv_listener = async_track_state_change_event(
+            self.hass, list(entity_ids), self._handle_trv_state_change
+        )
+
+    def _untrack_trv_entities(self) -> None:
+        """Stop tracking TRV entities and forget their stored values."""
+        if self._unsub_trv_listener:
+            self._unsub_trv_listener()
+            self._unsub_trv_listener = None
+        self._tracked_trv_entities = frozenset()
+        self._trv_values.clear()
+
+    @callback
+    def _handle_trv_state_change(self, event: Event) -> None:
+        """Update the stored values of a TRV entity when its state changes.
+
+        Args:
+            event: State change event
+        """
+        entity_id = event.data["entity_id"]
+        self._trv_values[entity_id] = self._extract_trv_values(
+            entity_id, event.data.get("new_state")
+        )
+
+    def _reuse_unchanged_area_data(self, area_id: str, area_data: dict) -> dict:
+        """Return the previous payload for an area if the new one is identical.
+
+        Handing back the same object lets the coordinator's change detection
+        (always_update=False) and any other equality checks short-circuit on
+        identity, so unchanged refreshes don't fan out to listeners.
+
+        Args:
+            area_id: Area identifier
+            area_data: Freshly built area data
+
+        Returns:
+            The previous payload when unchanged, otherwise the new one
+        """
+        previous = self._last_area_data.get(area_id)
+        if previous is not None and previous == area_data:
+            return previous
+        self._last_area_data[area_id] = area_data
+        return area_data
+
     def _get_trv_states_for_area(self, area: Area) -> list[dict]:
         """Collect TRV states for configured TRV entities in an area.
 
@@ -438,8 +552,10 @@ class SmartHeatingCoordinator(DataUpdateCoordinator):
         if not entity_id:
             return None
 
-        state = self.hass.states.get(entity_id)
-        open_state, position = self._extract_trv_values(entity_id, state)
+        values = self._trv_values.get(entity_id)
+        if values is None:
+            values = self._extract_trv_values(entity_id, self.hass.states.get(entity_id))
+        open_state, position = values
 
         return {
             "entity_id": entity_id,
@@ -695,11 +811,20 @@ class SmartHeatingCoordinator(DataUpdateCoordinator):
                 "area_count": len(areas),
                 "areas": {},
                 "opentherm_gateway": gateway_state,
+                # Read by the consumption sensors; included so a settings change
+                # makes the payload differ and listeners are notified
+                "default_min_consumption": self.area_manager.default_min_consumption,
+                "default_max_consumption": self.area_manager.default_max_consumption,
             }
 
+            # TRV values are pushed by state change events instead of polled
+            self._track_trv_entities(areas)
+
             # Add area information with device states
             for area_id, area in areas.items():
-                data["areas"][area_id] = self._build_area_data(area_id, area)
+                data["areas"][area_id] = self._reuse_unchanged_area_data(
+                    area_id, self._build_area_data(area_id, area)
+                )
 
                 # Record temperature for trend tracking and proactive maintenance
                 if area.current_temperature is not None:
@@ -715,6 +840,10 @@ class SmartHeatingCoordinator(DataUpdateCoordinator):
                         area.target_temperature if area.target_temperature is not None else "N/A",
                     )
 
+            # Forget payloads of areas that no longer exist
+            for stale_area_id in self._last_area_data.keys() - areas.keys():
+                del self._last_area_data[stale_area_id]
+
             _LOGGER.debug("Smart Heating data updated successfully: %d areas", len(areas))
             return data
 
@@ -6,8 +6,11 @@ detecting what features they support and determining optimal control parameters.
 
 import asyncio
 import logging
+import re
+import sys
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from homeassistant.core import HomeAssistant, State
@@ -29,8 +32,51 @@ SUPPORT_AUX_HEAT = 64
 SUPPORT_TURN_OFF = 128
 SUPPORT_TURN_ON = 256
 
+# Entity ID fragments identifying TRVs (Dutch "radiatorknop", "trv", any "*valve")
+_TRV_PATTERN = re.compile(r"radiator_?knop|trv|valve", re.IGNORECASE)
 
-@dataclass
+
+@lru_cache(maxsize=2048)
+def _classify_device(
+    entity_id: str,
+    device_class: str | None,
+    hvac_modes: tuple[str, ...],
+    integration: str,
+) -> str:
+    """Classify a device from the hashable parts of its entity and state.
+
+    The result depends only on the arguments, so it is memoized across
+    discovery runs.
+
+    Args:
+        entity_id: Entity ID
+        device_class: Device class attribute
+        hvac_modes: Supported HVAC modes
+        integration: Integration domain
+
+    Returns:
+        Device type string
+    """
+    # Check for TRV indicators
+    if _TRV_PATTERN.search(entity_id):
+        return "trv"
+
+    # Check for AC indicators
+    if device_class == "ac":
+        return "ac_unit"
+
+    if "cool" in hvac_modes or "heat_cool" in hvac_modes:
+        return "ac_unit"
+
+    # Check for valve with position control
+    if integration == "mqtt" and "valve" in entity_id.lower():
+        return "valve"
+
+    # Default to regular thermostat
+    return "thermostat"
+
+
+@dataclass(frozen=True, slots=True)
 class DeviceCapabilities:
     """Device capability profile.
 
@@ -42,7 +88,7 @@ class DeviceCapabilities:
     supports_turn_on: bool
     supports_temperature: bool
     supports_position: bool
-    supports_hvac_modes: list[str]
+    supports_hvac_modes: tuple[str, ...]
 
     # Temperature control
     min_temp: float
@@ -71,7 +117,7 @@ class DeviceCapabilities:
             "supports_turn_on": self.supports_turn_on,
             "supports_temperature": self.supports_temperature,
             "supports_position": self.supports_position,
-            "supports_hvac_modes": self.supports_hvac_modes,
+            "supports_hvac_modes": list(self.supports_hvac_modes),
             "min_temp": self.min_temp,
             "max_temp": self.max_temp,
             "temp_step": self.temp_step,
@@ -94,7 +140,7 @@ class DeviceCapabilities:
             supports_turn_on=data.get("supports_turn_on", False),
             supports_temperature=data.get("supports_temperature", True),
             supports_position=data.get("supports_position", False),
-            supports_hvac_modes=data.get("supports_hvac_modes", []),
+            supports_hvac_modes=tuple(data.get("supports_hvac_modes", ())),
             min_temp=data.get("min_temp", 5.0),
             max_temp=data.get("max_temp", 35.0),
             temp_step=data.get("temp_step", 0.5),
@@ -175,10 +221,59 @@ class DeviceCapabilityDetector:
         # Minimal async operation to satisfy async requirement (awaited by callers)
         await asyncio.sleep(0)
 
+        return self._build_profile(entity_id, er.async_get(self.hass), dr.async_get(self.hass))
+
+    async def discover_batch(self, entity_ids: list[str]) -> dict[str, DeviceProfile]:
+        """Discover capabilities of several climate devices.
+
+        The entity and device registries are fetched once for the whole batch
+        instead of once per entity.
+
+        Args:
+            entity_ids: Climate entity IDs to discover
+
+        Returns:
+            Dictionary of entity_id -> DeviceProfile; entities that are not
+            found are left out
+        """
+        await asyncio.sleep(0)
+
+        entity_reg = er.async_get(self.hass)
+        device_reg = dr.async_get(self.hass)
+        profiles: dict[str, DeviceProfile] = {}
+        for entity_id in entity_ids:
+            try:
+                profiles[entity_id] = self._build_profile(entity_id, entity_reg, device_reg)
+            except (ValueError, AttributeError) as err:
+                _LOGGER.debug("Could not discover capabilities for %s: %s", entity_id, err)
+        return profiles
+
+    def _build_profile(
+        self,
+        entity_id: str,
+        entity_reg: er.EntityRegistry,
+        device_reg: dr.DeviceRegistry,
+    ) -> DeviceProfile:
+        """Build the device profile of a climate entity.
+
+        Args:
+            entity_id: Climate entity ID to discover
+            entity_reg: Entity registry
+            device_reg: Device registry
+
+        Returns:
+            DeviceProfile with discovered capabilities
+
+        Raises:
+            ValueError: If entity not found
+        """
         state = self.hass.states.get(entity_id)
         if not state:
             raise ValueError(f"Entity {entity_id} not found")
 
+        # The ID keys the profile cache and is repeated in the profile itself
+        entity_id = sys.intern(entity_id)
+
         # 1. Check HA supported_features
         features = state.attributes.get("supported_features", 0)
         supports_turn_off = bool(features & SUPPORT_TURN_OFF)
@@ -186,11 +281,11 @@ class DeviceCapabilityDetector:
         supports_target_temp = bool(features & SUPPORT_TARGET_TEMPERATURE)
 
         # 2. Get HVAC modes
-        hvac_modes = state.attributes.get("hvac_modes", [])
+        hvac_modes = tuple(state.attributes.get("hvac_modes", ()))
 
         # 3. Get device info
         integration = entity_id.split(".")[0]
-        device_info = self._get_device_info(entity_id)
+        device_info = self._get_device_info(entity_id, entity_reg, device_reg)
 
         # 4. Determine device type
         device_type = self._detect_device_type(entity_id, state, integration)
@@ -259,35 +354,12 @@ class DeviceCapabilityDetector:
         Returns:
             Device type string
         """
-        entity_lower = entity_id.lower()
-
-        # Check for TRV indicators
-        trv_patterns = [
-            "radiatorknop",
-            "radiator_knop",
-            "trv",
-            "radiator_valve",
-            "thermostatic_valve",
-            "valve",
-        ]
-        if any(pattern in entity_lower for pattern in trv_patterns):
-            return "trv"
-
-        # Check for AC indicators
-        device_class = state.attributes.get("device_class")
-        if device_class == "ac":
-            return "ac_unit"
-
-        hvac_modes = state.attributes.get("hvac_modes", [])
-        if "cool" in hvac_modes or "heat_cool" in hvac_modes:
-            return "ac_unit"
-
-        # Check for valve with position control
-        if integration == "mqtt" and "valve" in entity_lower:
-            return "valve"
-
-        # Default to regular thermostat
-        return "thermostat"
+        return _classify_device(
+            entity_id,
+            state.attributes.get("device_class"),
+            tuple(state.attributes.get("hvac_modes", ())),
+            integration,
+        )
 
     def _get_optimal_parameters(self, device_type: str) -> dict[str, float | None]:
         """Get optimal control parameters for device type.
@@ -328,22 +400,27 @@ class DeviceCapabilityDetector:
                 "heating_offset": 0.0,
             }
 
-    def _get_device_info(self, entity_id: str) -> dict[str, str | None]:
+    def _get_device_info(
+        self,
+        entity_id: str,
+        entity_reg: er.EntityRegistry,
+        device_reg: dr.DeviceRegistry,
+    ) -> dict[str, str | None]:
         """Get device information from device registry.
 
         Args:
             entity_id: Entity ID
+            entity_reg: Entity registry
+            device_reg: Device registry
 
         Returns:
             Dictionary with manufacturer and model
         """
-        entity_reg = er.async_get(self.hass)
         entity_entry = entity_reg.async_get(entity_id)
 
         if not entity_entry or not entity_entry.device_id:
             return {"manufacturer": None, "model": None}
 
-        device_reg = dr.async_get(self.hass)
         device_entry = device_reg.async_get(entity_entry.device_id)
 
         if not device_entry:
@@ -419,6 +496,19 @@ class DeviceCapabilityDetector:
         self._profiles[entity_id] = profile
         return profile
 
+    async def discover_and_cache_batch(self, entity_ids: list[str]) -> dict[str, DeviceProfile]:
+        """Discover several devices and cache their profiles.
+
+        Args:
+            entity_ids: Entity IDs to discover
+
+        Returns:
+            Dictionary of entity_id -> DeviceProfile for the discovered devices
+        """
+        profiles = await self.discover_batch(entity_ids)
+        self._profiles.update(profiles)
+        return profiles
+
     def load_profiles(self, profiles_data: dict[str, dict[str, Any]]) -> None:
         """Load device profiles from storage.
 
@@ -2,14 +2,32 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
-from datetime import datetime, timezone
+import copy
+import sys
+import time
+from dataclasses import dataclass
 from typing import Any, Dict
 
-from ..const import TIMEZONE_SUFFIX
+# Last formatted timestamp, reused for events logged within the same second
+_LAST_TS_SEC = 0
+_LAST_TS_STR = ""
 
 
-@dataclass
+def _utc_timestamp() -> str:
+    """Return the current UTC time as an ISO8601 string with a "Z" suffix.
+
+    Formatting happens at most once per second; bursts of device events
+    within the same second share the cached string.
+    """
+    global _LAST_TS_SEC, _LAST_TS_STR
+    now_s = int(time.time())
+    if now_s != _LAST_TS_SEC:
+        _LAST_TS_SEC = now_s
+        _LAST_TS_STR = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now_s))
+    return _LAST_TS_STR
+
+
+@dataclass(slots=True, frozen=True)
 class DeviceEvent:
     """Represents a single device command/event sent or received.
 
@@ -33,6 +51,15 @@ class DeviceEvent:
     status: str | None = None
     error: str | None = None
 
+    def __post_init__(self) -> None:
+        """Intern the repeated identifier fields."""
+        # Identifiers repeat across every event in the device logs; intern them
+        # so all events share one string object per value.
+        for name in ("area_id", "device_id", "direction", "command_type"):
+            value = getattr(self, name)
+            if type(value) is str:
+                object.__setattr__(self, name, sys.intern(value))
+
     @classmethod
     def now(
         cls,
@@ -45,7 +72,7 @@ class DeviceEvent:
         error: str | None = None,
     ) -> "DeviceEvent":
         return cls(
-            timestamp=datetime.now(timezone.utc).isoformat().replace(TIMEZONE_SUFFIX, "Z"),
+            timestamp=_utc_timestamp(),
             area_id=area_id,
             device_id=device_id,
             direction=direction,
@@ -56,7 +83,17 @@ class DeviceEvent:
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "timestamp": self.timestamp,
+            "area_id": self.area_id,
+            "device_id": self.device_id,
+            "direction": self.direction,
+            "command_type": self.command_type,
+            # Copied like asdict() did, so consumers cannot mutate the stored event
+            "payload": copy.deepcopy(self.payload),
+            "status": self.status,
+            "error": self.error,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "DeviceEvent":
@@ -5,19 +5,24 @@ import logging
 from typing import Any
 
 from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
 
 from ..const import ATTR_AREA_ID, ATTR_HVAC_MODE, ATTR_TEMPERATURE
 from ..core.area_manager import AreaManager
 from ..core.coordinator import SmartHeatingCoordinator
+from ..exceptions import SmartHeatingError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maximum number of thermostats forced concurrently
+MAX_CONCURRENT_THERMOSTATS = 8
 
-async def _turn_on_power_switch_if_present(hass, thermostat_id: str) -> None:
-    """Try to find and turn on a matching power switch for the thermostat.
 
-    This will try a few common switch entity_id patterns and wait briefly for
-    the switch to report 'on'."""
+def _find_power_switch(hass, thermostat_id: str) -> str | None:
+    """Find a matching power switch for the thermostat.
+
+    This will try a few common switch entity_id patterns and return the first
+    one that exists."""
     if "." in thermostat_id:
         base = thermostat_id.split(".", 1)[1]
     else:
@@ -30,13 +35,9 @@ async def _turn_on_power_switch_if_present(hass, thermostat_id: str) -> None:
     ]
 
     for switch_id in power_switch_patterns:
-        state = hass.states.get(switch_id)
-        if not state:
-            continue
-
-        # Turn the switch on if needed and wait for it to report 'on'.
-        await _turn_on_switch(hass, switch_id)
-        break
+        if hass.states.get(switch_id):
+            return switch_id
+    return None
 
 
 async def _turn_on_switch(hass, switch_id: str) -> None:
@@ -98,9 +99,10 @@ async def _force_single_thermostat(
     """Force updates for a single thermostat.
 
     Steps:
-    1. Turn on any associated power switch if exists and wait for it to report 'on'.
-    2. If climate entity state is not 'on', call climate.turn_on as fallback.
-    3. Set HVAC mode (if provided) and set temperature (if provided).
+    1. If climate entity state is not 'on', call climate.turn_on as fallback.
+    2. Set HVAC mode (if provided) and set temperature (if provided).
+
+    Associated power switches are turned on beforehand by the caller.
 
     Args:
         hass: Home Assistant instance
@@ -114,9 +116,7 @@ async def _force_single_thermostat(
     """
     _LOGGER.info("Diagnostic: Forcing updates for thermostat %s (area=%s)", thermostat_id, area_id)
 
-    # Try to ensure any associated power switch is on, then ensure the
-    # climate entity itself is on and apply requested settings.
-    await _turn_on_power_switch_if_present(hass, thermostat_id)
+    # Ensure the climate entity itself is on and apply requested settings.
     await _ensure_climate_on(hass, thermostat_id)
 
     if hvac_mode:
@@ -161,10 +161,40 @@ async def async_handle_force_thermostat_update(
 
     hass = coordinator.hass
 
-    for thermostat_id in thermostats:
-        try:
-            await _force_single_thermostat(hass, thermostat_id, area_id, target_temp, hvac_mode)
-        except (HomeAssistantError, SmartHeatingError, RuntimeError) as err:
-            _LOGGER.exception(
-                "Diagnostic: Error while forcing thermostat %s: %s", thermostat_id, err
-            )
+    # Thermostats may share a power switch; turn each one on only once, and
+    # wait for all of them concurrently.
+    switch_by_thermostat = {
+        thermostat_id: _find_power_switch(hass, thermostat_id) for thermostat_id in thermostats
+    }
+    switches = list(set(switch_by_thermostat.values()) - {None})
+    results = await asyncio.gather(
+        *(_turn_on_switch(hass, switch_id) for switch_id in switches), return_exceptions=True
+    )
+    failed_switches = set()
+    for switch_id, result in zip(switches, results, strict=True):
+        if isinstance(result, (HomeAssistantError, SmartHeatingError, RuntimeError)):
+            _LOGGER.error("Diagnostic: Error while turning on switch %s: %s", switch_id, result)
+            failed_switches.add(switch_id)
+        elif isinstance(result, BaseException):
+            raise result
+
+    # Thermostats behind a switch that could not be turned on are skipped
+    thermostats = [
+        thermostat_id
+        for thermostat_id in thermostats
+        if switch_by_thermostat[thermostat_id] not in failed_switches
+    ]
+
+    # Force thermostats concurrently, bounded to avoid flooding the service bus
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_THERMOSTATS)
+
+    async def _force(thermostat_id: str) -> None:
+        async with semaphore:
+            try:
+                await _force_single_thermostat(hass, thermostat_id, area_id, target_temp, hvac_mode)
+            except (HomeAssistantError, SmartHeatingError, RuntimeError) as err:
+                _LOGGER.exception(
+                    "Diagnostic: Error while forcing thermostat %s: %s", thermostat_id, err
+                )
+
+    await asyncio.gather(*(_force(thermostat_id) for thermostat_id in thermostats))
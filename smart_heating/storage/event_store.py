@@ -5,11 +5,14 @@
 
 import asyncio
 import logging
+from bisect import bisect_left, insort
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.recorder import get_instance
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
@@ -41,11 +44,41 @@ DB_TABLE_NOT_INITIALIZED = "Database table not initialized"
 STORAGE_VERSION = 1
 STORAGE_KEY = "smart_heating_events"
 CLEANUP_INTERVAL = timedelta(hours=1)  # Run cleanup every hour
+SECONDS_PER_DAY = 86400
+# Caps memory of the parse cache; larger histories evict entries and re-parse them
+PARSED_START_TIME_CACHE_SIZE = 8192
+
+# Database inserts are buffered and written in batches
+DB_FLUSH_MAX_BATCH = 50  # Flush immediately once this many events are pending
+DB_FLUSH_DELAY = timedelta(seconds=1)  # Maximum time an event waits before flushing
+
+# JSON saves after recording events are coalesced into one write per window
+JSON_SAVE_DELAY = 2  # seconds
 
 # Database table name
 DB_TABLE_NAME = "smart_heating_events"
 
 
+@lru_cache(maxsize=PARSED_START_TIME_CACHE_SIZE)
+def _parse_start_time(start_time: str) -> float:
+    """Parse an ISO start time into a POSIX timestamp.
+
+    Memoized so bisects in queries and cleanups mostly hit the cache instead
+    of re-parsing the same strings; the cache is bounded, not sized to the
+    retention window.
+    """
+    return datetime.fromisoformat(start_time).timestamp()
+
+
+def _start_timestamp(event: dict[str, Any]) -> float:
+    """Return the start time of an event as a POSIX timestamp.
+
+    Used as the sort key for the per-area event lists, which are kept
+    ordered by start time so range queries can bisect instead of scan.
+    """
+    return _parse_start_time(event["start_time"])
+
+
 class EventStore:
     """Store heating events for learning with optional database storage."""
 
@@ -66,6 +99,9 @@ class EventStore:
         self._db_engine = None
         self._db_validated = False
         self._db_validation_task = None
+        self._pending_db_events: list[tuple[str, dict[str, Any]]] = []
+        self._flush_unsub = None
+        self._final_write_unsub = None
 
         if self._storage_backend == EVENT_STORAGE_DATABASE:
             try:
@@ -291,6 +327,11 @@ class EventStore:
         )
         _LOGGER.info("Event cleanup scheduled every %s", CLEANUP_INTERVAL)
 
+        # Insert batched database events if Home Assistant stops without unloading us
+        self._final_write_unsub = self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_final_write
+        )
+
     async def _async_load_from_json(self) -> None:
         """Load events from JSON storage."""
         data = await self._store.async_load()
@@ -298,6 +339,8 @@ class EventStore:
         if data is not None:
             if "events" in data:
                 self._events = data["events"]
+                for events in self._events.values():
+                    events.sort(key=_start_timestamp)
             if "retention_days" in data:
                 self._retention_days = data["retention_days"]
             if "storage_backend" in data:
@@ -325,8 +368,8 @@ class EventStore:
 
             def _load():
                 with recorder.engine.connect() as conn:
-                    # Load all events, ordered by start_time
-                    stmt = select(db_table).order_by(db_table.c.start_time.desc())
+                    # Load all events, oldest first to match the in-memory ordering
+                    stmt = select(db_table).order_by(db_table.c.start_time.asc())
                     result = conn.execute(stmt)
 
                     events_dict = {}
@@ -382,79 +425,134 @@ class EventStore:
                 - heating_rate: Heating rate (°C/min)
                 - outdoor_temp: Outdoor temperature (optional)
         """
+        await self.async_record_events(area_id, [event_data])
+
+    async def async_record_events(self, area_id: str, events: list[dict[str, Any]]) -> None:
+        """Record several heating events for an area at once.
+
+        The events are persisted together: one JSON save, or one queued
+        database batch, instead of one write per event.
+
+        Args:
+            area_id: Area identifier
+            events: Event data dictionaries, as for async_record_event
+        """
+        if not events:
+            return
+
         if self._storage_backend == EVENT_STORAGE_DATABASE and self._db_table is not None:
-            await self._async_record_event_database(area_id, event_data)
+            await self._async_record_events_database(area_id, events)
         else:
-            await self._async_record_event_json(area_id, event_data)
+            await self._async_record_events_json(area_id, events)
 
-    async def _async_record_event_json(self, area_id: str, event_data: dict[str, Any]) -> None:
-        """Record event to JSON storage."""
+    def _add_events_to_cache(self, area_id: str, events: list[dict[str, Any]]) -> None:
+        """Insert events into the in-memory cache, keeping start-time order."""
         if area_id not in self._events:
             self._events[area_id] = []
 
-        self._events[area_id].append(event_data)
+        area_events = self._events[area_id]
+        for event_data in events:
+            insort(area_events, event_data, key=_start_timestamp)
 
-        # Save to JSON
-        await self._async_save_to_json()
+    async def _async_record_events_json(self, area_id: str, events: list[dict[str, Any]]) -> None:
+        """Record events to JSON storage."""
+        self._add_events_to_cache(area_id, events)
+
+        # The Store helper coalesces bursts of records into a single write and
+        # writes a pending one when Home Assistant shuts down
+        self._store.async_delay_save(self._build_save_dict, JSON_SAVE_DELAY)
 
         _LOGGER.debug(
-            "Recorded event for %s to JSON (total events: %d)",
+            "Recorded %d events for %s to JSON (total events: %d)",
+            len(events),
             area_id,
             len(self._events[area_id]),
         )
 
-    async def _async_record_event_database(self, area_id: str, event_data: dict[str, Any]) -> None:
-        """Record event to database."""
+    async def _async_record_events_database(
+        self, area_id: str, events: list[dict[str, Any]]
+    ) -> None:
+        """Queue events for a batched database insert.
+
+        The events are added to the in-memory cache right away. The insert is
+        written together with other pending events once DB_FLUSH_MAX_BATCH
+        events are queued or DB_FLUSH_DELAY has passed, whichever is first.
+        """
+        self._add_events_to_cache(area_id, events)
+
+        self._pending_db_events.extend((area_id, event_data) for event_data in events)
+
+        if len(self._pending_db_events) >= DB_FLUSH_MAX_BATCH:
+            await self._flush_pending_db()
+        elif self._flush_unsub is None:
+            self._flush_unsub = async_call_later(self.hass, DB_FLUSH_DELAY, self._async_flush_timer)
+
+    async def _async_flush_timer(self, _now: datetime) -> None:
+        """Flush pending database events when the flush delay expires."""
+        self._flush_unsub = None
+        try:
+            await self._flush_pending_db()
+        except StorageError:
+            # The JSON fallback already logged the failure; nothing to retry here
+            return
+
+    async def _flush_pending_db(self) -> None:
+        """Write all pending events to the database in a single executor job."""
+        if self._flush_unsub is not None:
+            self._flush_unsub()
+            self._flush_unsub = None
+
+        if not self._pending_db_events:
+            return
+
+        pending = self._pending_db_events
+        self._pending_db_events = []
+
         try:
             recorder = get_instance(self.hass)
             if not getattr(recorder, "engine", None):
                 raise RuntimeError(RECORDER_ENGINE_UNAVAILABLE)
             if self._db_table is None:
                 raise RuntimeError(DB_TABLE_NOT_INITIALIZED)
-            assert recorder.engine is not None
-            assert self._db_table is not None
 
             db_table = self._db_table
             engine = recorder.engine
             assert engine is not None
 
-            def _insert():
+            def _insert_many():
+                created_at = dt_util.now()
+                rows = [
+                    {
+                        "area_id": area_id,
+                        "start_time": datetime.fromisoformat(event_data["start_time"]),
+                        "end_time": datetime.fromisoformat(event_data["end_time"]),
+                        "start_temp": event_data["start_temp"],
+                        "end_temp": event_data["end_temp"],
+                        "duration_minutes": event_data["duration_minutes"],
+                        "temp_change": event_data["temp_change"],
+                        "heating_rate": event_data["heating_rate"],
+                        "outdoor_temp": event_data.get("outdoor_temp"),
+                        "created_at": created_at,
+                    }
+                    for area_id, event_data in pending
+                ]
                 with engine.connect() as conn:
-                    # Parse timestamps
-                    start_time = datetime.fromisoformat(event_data["start_time"])
-                    end_time = datetime.fromisoformat(event_data["end_time"])
-
-                    # Insert event
-                    stmt = db_table.insert().values(
-                        area_id=area_id,
-                        start_time=start_time,
-                        end_time=end_time,
-                        start_temp=event_data["start_temp"],
-                        end_temp=event_data["end_temp"],
-                        duration_minutes=event_data["duration_minutes"],
-                        temp_change=event_data["temp_change"],
-                        heating_rate=event_data["heating_rate"],
-                        outdoor_temp=event_data.get("outdoor_temp"),
-                        created_at=dt_util.now(),
-                    )
-                    conn.execute(stmt)
+                    conn.execute(db_table.insert(), rows)
                     conn.commit()
 
-            await recorder.async_add_executor_job(_insert)
-
-            # Also add to in-memory cache
-            if area_id not in self._events:
-                self._events[area_id] = []
-            self._events[area_id].append(event_data)
+            await recorder.async_add_executor_job(_insert_many)
 
-            _LOGGER.debug("Recorded event for %s to database", area_id)
+            _LOGGER.debug("Recorded %d events to database", len(pending))
 
-        except (SQLAlchemyError, RuntimeError, AttributeError) as e:
+        except (SQLAlchemyError, RuntimeError, AttributeError, ValueError) as e:
             _LOGGER.error(
-                "Failed to record event to database: %s, falling back to JSON", e, exc_info=True
+                "Failed to record %d events to database: %s, falling back to JSON",
+                len(pending),
+                e,
+                exc_info=True,
             )
-            # Fallback to JSON
-            await self._async_record_event_json(area_id, event_data)
+            # Events are already in the in-memory cache; persist them to JSON
+            await self._async_save_to_json()
 
     async def async_get_events(self, area_id: str, days: int | None = 30) -> list[dict[str, Any]]:
         """Get events for an area.
@@ -483,15 +581,12 @@ class EventStore:
 
         events = self._events[area_id]
 
-        if days is not None:
-            # Filter by time range
-            cutoff_time = dt_util.now() - timedelta(days=days)
-            events = [e for e in events if datetime.fromisoformat(e["start_time"]) >= cutoff_time]
-
-        # Sort by start_time (oldest first)
-        events_sorted = sorted(events, key=lambda e: e["start_time"])
+        if days is None:
+            return list(events)
 
-        return events_sorted
+        # Events are kept sorted by start_time, so the range is a tail slice
+        cutoff_ts = dt_util.utcnow().timestamp() - days * SECONDS_PER_DAY
+        return events[bisect_left(events, cutoff_ts, key=_start_timestamp) :]
 
     async def _async_get_events_database(
         self, area_id: str, days: int | None = 30
@@ -555,10 +650,13 @@ class EventStore:
         Returns:
             Total number of events
         """
+        # The in-memory cache mirrors the database once loaded, so only areas
+        # missing from it need a COUNT query
+        if area_id in self._events:
+            return len(self._events[area_id])
         if self._storage_backend == EVENT_STORAGE_DATABASE and self._db_table is not None:
             return await self._async_get_event_count_database(area_id)
-        else:
-            return len(self._events.get(area_id, []))
+        return 0
 
     async def _async_get_event_count_database(self, area_id: str) -> int:
         """Get event count from database."""
@@ -630,15 +728,26 @@ class EventStore:
             _LOGGER.error("Failed to get database stats: %s", e, exc_info=True)
             return {"total_entries": 0}
 
+    def _build_save_dict(self) -> dict[str, Any]:
+        """Build the JSON storage payload from a snapshot of the events.
+
+        Store encodes the payload in an executor thread, so the per-area
+        lists are copied here on the event loop to keep later records and
+        cleanups from mutating them mid-encode.
+
+        Returns:
+            Dictionary to persist with the Store helper
+        """
+        return {
+            "events": {area_id: list(events) for area_id, events in self._events.items()},
+            "retention_days": self._retention_days,
+            "storage_backend": self._storage_backend,
+        }
+
     async def _async_save_to_json(self) -> None:
         """Save events to JSON storage."""
         try:
-            data = {
-                "events": self._events,
-                "retention_days": self._retention_days,
-                "storage_backend": self._storage_backend,
-            }
-            await self._store.async_save(data)
+            await self._store.async_save(self._build_save_dict())
         except (OSError, ValueError, TypeError) as e:
             _LOGGER.error("Failed to save events to JSON: %s", e, exc_info=True)
             raise StorageError(f"Failed to save events to JSON storage: {e}") from e
@@ -655,20 +764,10 @@ class EventStore:
     async def _async_cleanup_json(self, cutoff_time: datetime) -> None:
         """Clean up old events from JSON storage."""
         cleaned_count = 0
+        cutoff_ts = cutoff_time.timestamp()
 
-        area_ids = list(self._events)
-        for area_id in area_ids:
-            original_count = len(self._events[area_id])
-            self._events[area_id] = [
-                e
-                for e in self._events[area_id]
-                if datetime.fromisoformat(e["start_time"]) >= cutoff_time
-            ]
-            cleaned_count += original_count - len(self._events[area_id])
-
-            # Remove area if no events left
-            if not self._events[area_id]:
-                del self._events[area_id]
+        for area_id in list(self._events):
+            cleaned_count += self._drop_events_before(area_id, cutoff_ts)
 
         if cleaned_count > 0:
             await self._async_save_to_json()
@@ -699,19 +798,33 @@ class EventStore:
                 _LOGGER.info("Cleaned up %d old events from database", rows_deleted)
 
                 # Also clean up in-memory cache
-                area_ids = list(self._events)
-                for area_id in area_ids:
-                    self._events[area_id] = [
-                        e
-                        for e in self._events[area_id]
-                        if datetime.fromisoformat(e["start_time"]) >= cutoff_time
-                    ]
-                    if not self._events[area_id]:
-                        del self._events[area_id]
+                cutoff_ts = cutoff_time.timestamp()
+                for area_id in list(self._events):
+                    self._drop_events_before(area_id, cutoff_ts)
 
         except (SQLAlchemyError, RuntimeError, AttributeError, ValueError) as e:
             _LOGGER.error("Failed to cleanup database: %s", e, exc_info=True)
 
+    def _drop_events_before(self, area_id: str, cutoff_ts: float) -> int:
+        """Drop in-memory events for an area that started before the cutoff.
+
+        Args:
+            area_id: Area identifier
+            cutoff_ts: POSIX timestamp; events starting before it are removed
+
+        Returns:
+            Number of events removed
+        """
+        events = self._events[area_id]
+        removed = bisect_left(events, cutoff_ts, key=_start_timestamp)
+        del events[:removed]
+
+        # Remove area if no events left
+        if not events:
+            del self._events[area_id]
+
+        return removed
+
     async def _async_periodic_cleanup(self, now: datetime) -> None:
         """Periodic cleanup task.
 
@@ -721,12 +834,24 @@ class EventStore:
         _LOGGER.debug("Running periodic event cleanup")
         await self._async_cleanup_old_events()
 
+    async def _async_final_write(self, _event: Event) -> None:
+        """Insert batched database events when Home Assistant is shutting down."""
+        self._final_write_unsub = None
+        await self._flush_pending_db()
+
     async def async_close(self) -> None:
         """Close the event store and cleanup."""
         if self._cleanup_unsub is not None:
             self._cleanup_unsub()
             self._cleanup_unsub = None
 
+        if self._final_write_unsub is not None:
+            self._final_write_unsub()
+            self._final_write_unsub = None
+
+        # Write any events still waiting for a batched database insert
+        await self._flush_pending_db()
+
         # Final save to JSON if using JSON backend
         if self._storage_backend == EVENT_STORAGE_JSON:
             await self._async_save_to_json()
@@ -4,24 +4,34 @@
 # pragma: no cover
 
 import asyncio
-import json
 import logging
+import time
+from collections import deque
+from collections.abc import Iterable
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.json import json_dumps
 from homeassistant.helpers.storage import Store
+from homeassistant.util.json import json_loads
 from sqlalchemy import (
     Column,
     DateTime,
     Float,
+    Index,
     Integer,
     MetaData,
     String,
     Table,
+    bindparam,
     delete,
+    func,
     select,
 )
 from sqlalchemy.exc import SQLAlchemyError
@@ -41,10 +51,56 @@ DB_TABLE_NOT_INITIALIZED = "Database table not initialized"
 
 STORAGE_VERSION = 1
 STORAGE_KEY = "smart_heating_history"
+VALID_STORAGE_BACKENDS = frozenset({HISTORY_STORAGE_JSON, HISTORY_STORAGE_DATABASE})
 CLEANUP_INTERVAL = timedelta(hours=1)  # Run cleanup every hour
+JSON_SAVE_DELAY = 5  # Seconds in which recorded entries share one save
 
 # Database table name
 DB_TABLE_NAME = "smart_heating_history"
+DB_AREA_TIMESTAMP_INDEX = "ix_smart_heating_history_area_id_timestamp"
+DB_LOAD_BATCH_SIZE = 1000  # Rows fetched per round-trip when loading history
+MAX_HISTORY_ENTRIES = 1000  # Entries kept in memory per area
+DB_PURGE_BATCH_SIZE = 1000  # Rows deleted per transaction during cleanup
+DB_STATS_CACHE_TTL = 30.0  # Seconds a database row count is reused
+
+# Lowercase form of every area state, keyed by each spelling seen in stored
+# history, so normalizing a known state is a dict lookup instead of lower()
+_STATE_NORM: dict[str, str] = {
+    spelling: state
+    for state in ("heating", "idle", "off", "cooling", "manual", "heating_no_feedback")
+    for spelling in (state, state.upper(), state.capitalize())
+}
+
+
+def _normalize_state(state: Any) -> Any:
+    """Return the lowercase form of a state string, leaving other values as-is."""
+    if isinstance(state, str):
+        return _STATE_NORM.get(state) or state.lower()
+    return state
+
+
+@lru_cache(maxsize=4)
+def _count_statement(db_table: Table) -> Any:
+    """Return the row count statement for a history table, built once per table."""
+    return select(func.count()).select_from(db_table)
+
+
+@lru_cache(maxsize=4)
+def _purge_statements(db_table: Table) -> tuple[Any, Any]:
+    """Return the statements used to purge a history table, built once per table.
+
+    Args:
+        db_table: Database table object
+
+    Returns:
+        Tuple of (select expired ids, delete by ids); both take bound parameters
+    """
+    cols = db_table.c
+    select_ids = (
+        select(cols.id).where(cols.timestamp < bindparam("cutoff")).limit(DB_PURGE_BATCH_SIZE)
+    )
+    delete_ids = delete(db_table).where(cols.id.in_(bindparam("ids", expanding=True)))
+    return select_ids, delete_ids
 
 
 class HistoryTracker:
@@ -60,13 +116,14 @@ class HistoryTracker:
         self.hass = hass
         self._storage_backend = storage_backend
         self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
-        self._history: dict[str, list[dict[str, Any]]] = {}
+        self._history: dict[str, deque[dict[str, Any]]] = {}
         self._retention_days: int = DEFAULT_HISTORY_RETENTION_DAYS
         self._cleanup_unsub = None
         self._db_table = None
         self._db_engine = None
         self._db_validated = False
         self._db_validation_task = None
+        self._stats_cache: tuple[float, dict[str, Any]] | None = None
         # Quick validation for database backend at init time to satisfy tests
         if self._storage_backend == HISTORY_STORAGE_DATABASE:
             try:
@@ -133,7 +190,7 @@ class HistoryTracker:
                     else "PostgreSQL"
                 )
                 _LOGGER.info("Database storage enabled with %s", db_type)
-                self._init_database_table()
+                await self._async_init_database_table(recorder)
                 self._db_validated = True
             else:
                 _LOGGER.debug("Unsupported database type for history storage, falling back to JSON")
@@ -191,7 +248,7 @@ class HistoryTracker:
 
         if any(db in db_url.lower() for db in ["mysql", "mariadb", "postgresql", "postgres"]):
             _LOGGER.info("Recorder available: enabling history database storage")
-            self._init_database_table()
+            await self._async_init_database_table(recorder)
             # If DB contains entries, switch to DB-backed storage and load them
             try:
                 stats = await self.async_get_database_stats()
@@ -210,6 +267,17 @@ class HistoryTracker:
         self._storage_backend = HISTORY_STORAGE_JSON
         self._db_validated = True
 
+    async def _async_init_database_table(self, recorder) -> None:
+        """Initialize the database table on the recorder's database executor.
+
+        Creating the table and index and checking the 'trvs' column all talk
+        to the database, so they must not run on the event loop.
+
+        Args:
+            recorder: Recorder instance
+        """
+        await recorder.async_add_executor_job(self._init_database_table)
+
     def _init_database_table(self) -> None:
         """Initialize the database table for history storage."""
         try:
@@ -220,6 +288,7 @@ class HistoryTracker:
             assert self._db_engine is not None
 
             metadata = MetaData()
+            area_timestamp_index = Index(DB_AREA_TIMESTAMP_INDEX, "area_id", "timestamp")
             self._db_table = Table(
                 DB_TABLE_NAME,
                 metadata,
@@ -230,11 +299,19 @@ class HistoryTracker:
                 Column("target_temperature", Float, nullable=False),
                 Column("state", String(50), nullable=False),
                 Column("trvs", String, nullable=True),
+                area_timestamp_index,
             )
 
             # Create table if it doesn't exist
             metadata.create_all(self._db_engine)
 
+            # Tables created by older versions lack the composite index used
+            # by the per-area, time-ordered load query
+            try:
+                area_timestamp_index.create(self._db_engine, checkfirst=True)
+            except SQLAlchemyError as err:
+                _LOGGER.debug("Could not add index %s: %s", DB_AREA_TIMESTAMP_INDEX, err)
+
             # Ensure 'trvs' column exists (migrated to helper)
             try:
                 self._ensure_trvs_column()
@@ -336,17 +413,17 @@ class HistoryTracker:
                 if total and int(total) > 0:
                     # Prefer DB-backed history if entries exist
                     self._storage_backend = HISTORY_STORAGE_DATABASE
-                    await self._async_load_from_database()
+                    await self._async_load_from_database(data)
                 else:
                     # No DB entries: fall back to JSON storage
-                    await self._async_load_from_json()
+                    await self._async_load_from_json(data)
             except (SQLAlchemyError, RuntimeError, ValueError) as err:
                 # In case of any error querying DB, fall back to JSON to avoid
                 # leaving the integration without history at startup
                 _LOGGER.warning("Failed to load from database: %s, using JSON", err)
-                await self._async_load_from_json()
+                await self._async_load_from_json(data)
         else:
-            await self._async_load_from_json()
+            await self._async_load_from_json(data)
 
         # Schedule periodic cleanup
         self._cleanup_unsub = async_track_time_interval(
@@ -354,13 +431,27 @@ class HistoryTracker:
         )
         _LOGGER.info("History cleanup scheduled every %s", CLEANUP_INTERVAL)
 
-    async def _async_load_from_json(self) -> None:
-        """Load history from JSON storage."""
-        data = await self._store.async_load()
+    async def _async_load_from_json(self, data: dict[str, Any] | None = None) -> None:
+        """Load history from JSON storage.
+
+        Args:
+            data: Stored data already read by the caller; read from the store if omitted
+        """
+        if data is None:
+            data = await self._store.async_load()
 
         if data is not None:
             if "history" in data:
-                self._history = data["history"]
+                # Older versions stored states as reported; normalize them
+                # once here so reads can return entries untouched
+                for entries in data["history"].values():
+                    for entry in entries:
+                        if "state" in entry:
+                            entry["state"] = _normalize_state(entry["state"])
+                self._history = {
+                    area_id: deque(entries, maxlen=MAX_HISTORY_ENTRIES)
+                    for area_id, entries in data["history"].items()
+                }
             if "retention_days" in data:
                 self._retention_days = data["retention_days"]
             if "storage_backend" in data:
@@ -377,21 +468,22 @@ class HistoryTracker:
         else:
             _LOGGER.debug("No history found in JSON storage")
 
-    async def _async_load_from_database(self) -> None:
-        """Load history from database."""
+    async def _async_load_from_database(self, data: dict[str, Any] | None = None) -> None:
+        """Load history from database.
+
+        Args:
+            data: Stored settings already read by the caller; read from the store if omitted
+        """
         try:
             recorder, db_table = self._validate_database_prerequisites()
             engine = recorder.engine
             assert engine is not None
 
-            # Load history data from database
-            self._history = await self._load_history_from_db(recorder, engine, db_table)
+            # Load retention settings first so only retained rows are fetched
+            await self._load_retention_settings(data)
 
-            # Normalize state values
-            self._normalize_history_states()
-
-            # Load retention settings
-            await self._load_retention_settings()
+            # Load history data from database; states are normalized per row
+            self._history = await self._load_history_from_db(recorder, engine, db_table)
 
             # Clean up old entries
             await self._async_cleanup_old_entries()
@@ -438,54 +530,65 @@ class HistoryTracker:
             Dictionary of history data keyed by area_id
         """
 
+        cutoff = datetime.now() - timedelta(days=self._retention_days)
+
         def _load():
             with engine.connect() as conn:
-                return self._collect_history_rows(conn, db_table)
+                return self._collect_history_rows(conn, db_table, cutoff)
 
         return await recorder.async_add_executor_job(_load)
 
-    def _collect_history_rows(self, conn, db_table) -> dict:
-        """Collect history rows from database connection.
+    def _collect_history_rows(self, conn, db_table, cutoff: datetime) -> dict:
+        """Collect retained history rows from database connection.
+
+        Filtering and ordering are done by the database: rows arrive grouped
+        by area and oldest first, so each area's list is built in one pass.
 
         Args:
             conn: Database connection
             db_table: Database table object
+            cutoff: Rows with an older timestamp are not fetched
 
         Returns:
             Dictionary of history data keyed by area_id
         """
-        stmt = select(db_table).order_by(db_table.c.timestamp.desc())
+        cols = db_table.c
+        stmt = (
+            select(
+                cols.area_id,
+                cols.timestamp,
+                cols.current_temperature,
+                cols.target_temperature,
+                cols.state,
+                cols.trvs,
+            )
+            .where(cols.timestamp >= cutoff)
+            .order_by(cols.area_id, cols.timestamp)
+            .execution_options(yield_per=DB_LOAD_BATCH_SIZE)
+        )
         result = conn.execute(stmt)
 
-        history_dict = {}
-        for row in result:
-            self._add_row_to_history(history_dict, row)
-
-        return history_dict
+        return {
+            area_id: deque(map(self._row_to_entry, rows), maxlen=MAX_HISTORY_ENTRIES)
+            for area_id, rows in groupby(result, key=attrgetter("area_id"))
+        }
 
-    def _add_row_to_history(self, history_dict: dict, row) -> None:
-        """Add a database row to the history dictionary.
+    def _row_to_entry(self, row) -> dict[str, Any]:
+        """Convert a database row to a history entry.
 
         Args:
-            history_dict: History dictionary to update
-            row: Database row to add
+            row: Database row to convert
+
+        Returns:
+            History entry dictionary
         """
-        area_id = row.area_id
-        if area_id not in history_dict:
-            history_dict[area_id] = []
-
-        trvs = self._parse_trv_json(row.trvs)
-        state = self._normalize_state_value(row.state)
-
-        history_dict[area_id].append(
-            {
-                "timestamp": row.timestamp.isoformat(),
-                "current_temperature": row.current_temperature,
-                "target_temperature": row.target_temperature,
-                "state": state,
-                "trvs": trvs,
-            }
-        )
+        return {
+            "timestamp": row.timestamp.isoformat(),
+            "current_temperature": row.current_temperature,
+            "target_temperature": row.target_temperature,
+            "state": self._normalize_state_value(row.state),
+            "trvs": self._parse_trv_json(row.trvs),
+        }
 
     def _parse_trv_json(self, trvs_json: str) -> Any:
         """Parse TRV JSON data.
@@ -500,10 +603,9 @@ class HistoryTracker:
             return None
 
         try:
-            return json.loads(trvs_json)
-        # json.JSONDecodeError is a subclass of ValueError, so catching
-        # ValueError already handles JSON decoding errors; remove the
-        # redundant explicit JSONDecodeError to satisfy Sonar S5713.
+            return json_loads(trvs_json)
+        # The orjson decode error raised by json_loads is a subclass of
+        # ValueError, so catching ValueError handles malformed JSON too.
         except (TypeError, ValueError) as err:
             _LOGGER.debug("Failed to parse TRV JSON for row: %s", err)
             return None
@@ -517,20 +619,16 @@ class HistoryTracker:
         Returns:
             Lowercase state if string, otherwise original value
         """
-        if isinstance(state, str):
-            return state.lower()
-        return state
-
-    def _normalize_history_states(self) -> None:
-        """Normalize all state values in history to lowercase."""
-        for _area_id, entries in self._history.items():
-            for entry in entries:
-                if "state" in entry and isinstance(entry["state"], str):
-                    entry["state"] = entry["state"].lower()
-
-    async def _load_retention_settings(self) -> None:
-        """Load retention settings from JSON store."""
-        data = await self._store.async_load()
+        return _normalize_state(state)
+
+    async def _load_retention_settings(self, data: dict[str, Any] | None = None) -> None:
+        """Load retention settings from JSON store.
+
+        Args:
+            data: Stored settings already read by the caller; read from the store if omitted
+        """
+        if data is None:
+            data = await self._store.async_load()
         if data and "retention_days" in data:
             self._retention_days = data["retention_days"]
 
@@ -545,12 +643,19 @@ class HistoryTracker:
 
     async def _async_save_to_json(self) -> None:
         """Save history to JSON storage."""
-        data = {
-            "history": self._history,
+        await self._store.async_save(self._build_json_save_data())
+
+    def _build_json_save_data(self) -> dict[str, Any]:
+        """Build the JSON storage payload.
+
+        Returns:
+            Dictionary to persist with the Store helper
+        """
+        return {
+            "history": self.get_all_history(),
             "retention_days": self._retention_days,
             "storage_backend": self._storage_backend,
         }
-        await self._store.async_save(data)
 
     async def _async_save_to_database(self) -> None:
         """Save history to database."""
@@ -562,15 +667,17 @@ class HistoryTracker:
         }
         await self._store.async_save(data)
 
-    async def async_unload(
-        self,
-    ) -> None:  # NOSONAR - intentionally async (cleanup tasks may be awaited by caller)
+    async def async_unload(self) -> None:
         """Unload and cleanup."""
-        # Minimal await to satisfy async function linters
-        await asyncio.sleep(0)
         if self._cleanup_unsub:
             self._cleanup_unsub()
             self._cleanup_unsub = None
+
+        # Final save to JSON if using JSON backend; this replaces any delayed
+        # save still pending so a reloaded tracker starts from current data
+        if self._storage_backend == HISTORY_STORAGE_JSON:
+            await self._async_save_to_json()
+
         _LOGGER.debug("History tracker unloaded")
 
     async def async_get_database_stats(self) -> dict[str, Any]:
@@ -578,11 +685,18 @@ class HistoryTracker:
 
         Returns a dict containing `enabled` flag and either a `message` when
         database storage is not enabled, or `total_entries` when enabled.
+        The row count is reused for DB_STATS_CACHE_TTL seconds so repeated
+        polling does not re-run COUNT(*) against the recorder database.
         """
         # If no DB table or not using DB backend, return disabled response
         if self._db_table is None or self._storage_backend != HISTORY_STORAGE_DATABASE:
             return {"enabled": False, "message": "Database storage not enabled"}
 
+        if self._stats_cache is not None:
+            cached_at, cached_stats = self._stats_cache
+            if time.monotonic() - cached_at < DB_STATS_CACHE_TTL:
+                return cached_stats
+
         try:
             recorder = get_instance(self.hass)
             if not getattr(recorder, "engine", None):
@@ -595,14 +709,13 @@ class HistoryTracker:
 
             def _get_stats():
                 with engine.connect() as conn:
-                    from sqlalchemy import func
-
-                    stmt = select(func.count()).select_from(db_table)
-                    result = conn.execute(stmt)
+                    result = conn.execute(_count_statement(db_table))
                     total = result.scalar()
                     return {"enabled": True, "total_entries": total}
 
-            return await recorder.async_add_executor_job(_get_stats)
+            stats = await recorder.async_add_executor_job(_get_stats)
+            self._stats_cache = (time.monotonic(), stats)
+            return stats
 
         except (SQLAlchemyError, RuntimeError, AttributeError) as e:
             _LOGGER.error("Failed to get database stats: %s", e, exc_info=True)
@@ -621,21 +734,22 @@ class HistoryTracker:
         cutoff_iso = cutoff.isoformat()
 
         total_removed = 0
-        area_ids = list(self._history)
-        for area_id in area_ids:
-            original_count = len(self._history[area_id])
-            self._history[area_id] = [
-                entry for entry in self._history[area_id] if entry["timestamp"] > cutoff_iso
-            ]
-            removed = original_count - len(self._history[area_id])
+        for area_id, history in self._history.items():
+            # Timestamps are naive local time and can go backwards at a DST
+            # change, so entries are not assumed to be in order
+            if not any(entry["timestamp"] <= cutoff_iso for entry in history):
+                continue
+
+            kept = [entry for entry in history if entry["timestamp"] > cutoff_iso]
+            removed = len(history) - len(kept)
+            self._history[area_id] = deque(kept, maxlen=MAX_HISTORY_ENTRIES)
             total_removed += removed
-            if removed > 0:
-                _LOGGER.debug(
-                    "Removed %d old entries for area %s (retention: %d days)",
-                    removed,
-                    area_id,
-                    self._retention_days,
-                )
+            _LOGGER.debug(
+                "Removed %d old entries for area %s (retention: %d days)",
+                removed,
+                area_id,
+                self._retention_days,
+            )
 
         if total_removed > 0:
             _LOGGER.info(
@@ -664,14 +778,19 @@ class HistoryTracker:
 
             def _cleanup():
                 with engine.connect() as conn:
-                    stmt = delete(db_table).where(db_table.c.timestamp < cutoff)
-                    result = conn.execute(stmt)
-                    conn.commit()
-                    return result.rowcount
-
-            removed = await recorder.async_add_executor_job(_cleanup)
+                    return self._purge_history_batch(conn, db_table, cutoff)
+
+            # Delete in bounded batches, one transaction per executor job, so a
+            # large backlog never holds a long write lock on the recorder database
+            removed = 0
+            while True:
+                batch_removed = await recorder.async_add_executor_job(_cleanup)
+                removed += batch_removed
+                if batch_removed < DB_PURGE_BATCH_SIZE:
+                    break
 
             if removed > 0:
+                self._stats_cache = None
                 _LOGGER.info(
                     "History cleanup: removed %d entries older than %d days (Database)",
                     removed,
@@ -683,6 +802,26 @@ class HistoryTracker:
         except (SQLAlchemyError, RuntimeError, AttributeError) as e:
             _LOGGER.error("Failed to cleanup database: %s", e, exc_info=True)
 
+    def _purge_history_batch(self, conn, db_table, cutoff: datetime) -> int:
+        """Delete one batch of rows older than the cutoff.
+
+        Args:
+            conn: Database connection
+            db_table: Database table object
+            cutoff: Rows with an older timestamp are deleted
+
+        Returns:
+            Number of rows deleted, at most DB_PURGE_BATCH_SIZE
+        """
+        select_ids, delete_ids = _purge_statements(db_table)
+        ids = conn.execute(select_ids, {"cutoff": cutoff}).scalars().all()
+        if not ids:
+            return 0
+
+        conn.execute(delete_ids, {"ids": ids})
+        conn.commit()
+        return len(ids)
+
     async def _async_periodic_cleanup(self, now=None) -> None:
         """Periodic cleanup task."""
         _LOGGER.debug("Running periodic history cleanup")
@@ -705,50 +844,78 @@ class HistoryTracker:
             state: Area state (heating/idle/off)
             trvs: Optional list of TRV states to include in the entry
         """
-        timestamp = datetime.now()
-        entry = {
-            "timestamp": timestamp.isoformat(),
-            "current_temperature": current_temp,
-            "target_temperature": target_temp,
-            "state": state,
-            "trvs": trvs,
-        }
+        await self.async_record_temperatures([(area_id, current_temp, target_temp, state, trvs)])
 
-        # Always maintain in-memory cache
-        if area_id not in self._history:
-            self._history[area_id] = []
+    async def async_record_temperatures(
+        self,
+        readings: Iterable[tuple[str, float, float, str, list[dict] | None]],
+    ) -> None:
+        """Record temperature readings for several areas as one batch.
+
+        All readings share one timestamp; the database backend stores them in
+        a single insert and the JSON backend schedules a single save.
 
-        self._history[area_id].append(entry)
+        Args:
+            readings: (area_id, current_temp, target_temp, state, trvs) tuples
+        """
+        timestamp = datetime.now()
+        timestamp_iso = timestamp.isoformat()
+        rows: list[dict[str, Any]] = []
+
+        for area_id, current_temp, target_temp, raw_state, trvs in readings:
+            # Store the lowercase state the frontend compares against
+            state = _normalize_state(raw_state)
+
+            # Always maintain in-memory cache; the deque drops the oldest entry
+            # once an area holds MAX_HISTORY_ENTRIES
+            if area_id not in self._history:
+                self._history[area_id] = deque(maxlen=MAX_HISTORY_ENTRIES)
+
+            self._history[area_id].append(
+                {
+                    "timestamp": timestamp_iso,
+                    "current_temperature": current_temp,
+                    "target_temperature": target_temp,
+                    "state": state,
+                    "trvs": trvs,
+                }
+            )
+            rows.append(
+                {
+                    "area_id": area_id,
+                    "timestamp": timestamp,
+                    "current_temperature": current_temp,
+                    "target_temperature": target_temp,
+                    "state": state,
+                    "trvs": json_dumps(trvs) if trvs is not None else None,
+                }
+            )
 
-        # Limit to last 1000 entries per area in memory
-        if len(self._history[area_id]) > 1000:
-            self._history[area_id] = self._history[area_id][-1000:]
+            _LOGGER.debug(
+                "Recorded temperature for %s: %.1f°C (target: %.1f°C, state: %s) [%s]",
+                area_id,
+                current_temp,
+                target_temp,
+                state,
+                self._storage_backend,
+            )
+
+        if not rows:
+            return
 
-        # Persist to storage backend
+        # Persist to storage backend; the Store helper coalesces JSON saves
+        # and writes a pending one when Home Assistant shuts down
         if self._storage_backend == HISTORY_STORAGE_DATABASE and self._db_table is not None:
-            await self._async_save_to_database_entry(
-                area_id, timestamp, current_temp, target_temp, state, trvs
-            )
+            await self._async_save_to_database_rows(rows)
+        else:
+            self._store.async_delay_save(self._build_json_save_data, JSON_SAVE_DELAY)
 
-        _LOGGER.debug(
-            "Recorded temperature for %s: %.1f°C (target: %.1f°C, state: %s) [%s]",
-            area_id,
-            current_temp,
-            target_temp,
-            state,
-            self._storage_backend,
-        )
+    async def _async_save_to_database_rows(self, rows: list[dict[str, Any]]) -> None:
+        """Insert history rows into the database in one statement.
 
-    async def _async_save_to_database_entry(
-        self,
-        area_id: str,
-        timestamp: datetime,
-        current_temp: float,
-        target_temp: float,
-        state: str,
-        trvs: list[dict] | None = None,
-    ) -> None:
-        """Save a single entry to the database."""
+        Args:
+            rows: Column values for each row to insert
+        """
         try:
             recorder = get_instance(self.hass)
             if not getattr(recorder, "engine", None):
@@ -764,22 +931,14 @@ class HistoryTracker:
 
             def _insert():
                 with engine.connect() as conn:
-                    stmt = db_table.insert().values(
-                        area_id=area_id,
-                        timestamp=timestamp,
-                        current_temperature=current_temp,
-                        target_temperature=target_temp,
-                        state=state,
-                        trvs=json.dumps(trvs) if trvs is not None else None,
-                    )
-                    conn.execute(stmt)
+                    conn.execute(db_table.insert(), rows)
                     conn.commit()
 
             await recorder.async_add_executor_job(_insert)
 
         except (SQLAlchemyError, RuntimeError, AttributeError) as e:
-            _LOGGER.error("Failed to save entry to database: %s", e, exc_info=True)
-            raise StorageError(f"Failed to save history entry to database: {e}") from e
+            _LOGGER.error("Failed to save entries to database: %s", e, exc_info=True)
+            raise StorageError(f"Failed to save history entries to database: {e}") from e
 
     def get_history(
         self,
@@ -802,29 +961,21 @@ class HistoryTracker:
         if area_id not in self._history:
             return []
 
+        history = self._history[area_id]
+
         # Determine time range
         if start_time and end_time:
             # Custom time range
             start_iso = start_time.isoformat()
             end_iso = end_time.isoformat()
-            entries = [
-                entry
-                for entry in self._history[area_id]
-                if start_iso <= entry["timestamp"] <= end_iso
-            ]
+            entries = [entry for entry in history if start_iso <= entry["timestamp"] <= end_iso]
         elif hours:
             # Hours-based query
-            cutoff = datetime.now() - timedelta(hours=hours)
-            cutoff_iso = cutoff.isoformat()
-            entries = [entry for entry in self._history[area_id] if entry["timestamp"] > cutoff_iso]
+            cutoff_iso = (datetime.now() - timedelta(hours=hours)).isoformat()
+            entries = [entry for entry in history if entry["timestamp"] > cutoff_iso]
         else:
             # Return all available history (within retention period)
-            entries = list(self._history[area_id])
-
-        # Normalize state values on return to ensure frontend comparisons work
-        for entry in entries:
-            if "state" in entry and isinstance(entry["state"], str):
-                entry["state"] = entry["state"].lower()
+            entries = list(history)
 
         return entries
 
@@ -834,7 +985,7 @@ class HistoryTracker:
         Returns:
             Dictionary of area_id -> history entries
         """
-        return self._history
+        return {area_id: list(entries) for area_id, entries in self._history.items()}
 
     def set_retention_days(self, days: int) -> None:
         """Set the history retention period.
@@ -884,7 +1035,7 @@ class HistoryTracker:
             }
 
         # Validate target backend
-        if target_backend not in [HISTORY_STORAGE_JSON, HISTORY_STORAGE_DATABASE]:
+        if target_backend not in VALID_STORAGE_BACKENDS:
             return {
                 "success": False,
                 "message": f"Invalid storage backend: {target_backend}",
@@ -954,12 +1105,11 @@ class HistoryTracker:
 
     async def _migrate_to_database(self) -> None:
         """Migrate all in-memory history to database."""
-        if self._db_table is None:
-            self._init_database_table()
-
         recorder = get_instance(self.hass)
         if not getattr(recorder, "engine", None):
             raise RuntimeError(RECORDER_ENGINE_UNAVAILABLE)
+        if self._db_table is None:
+            await self._async_init_database_table(recorder)
         if self._db_table is None:
             raise RuntimeError(DB_TABLE_NOT_INITIALIZED)
         assert recorder.engine is not None
@@ -980,14 +1130,17 @@ class HistoryTracker:
                             current_temperature=entry["current_temperature"],
                             target_temperature=entry["target_temperature"],
                             state=entry["state"],
-                            trvs=json.dumps(entry.get("trvs"))
+                            trvs=json_dumps(entry.get("trvs"))
                             if entry.get("trvs") is not None
                             else None,
                         )
                         conn.execute(stmt)
                 conn.commit()
 
+        # Insert from a snapshot: recording keeps appending to the live deques on
+        # the event loop while this job iterates in the executor
         await recorder.async_add_executor_job(
-            _perform_batch_insert, engine, db_table, self._history
+            _perform_batch_insert, engine, db_table, self.get_all_history()
         )
+        self._stats_cache = None
         _LOGGER.info("Migrated all entries to database")
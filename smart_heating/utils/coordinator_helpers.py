@@ -10,6 +10,9 @@ from ..const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Top-level coordinator data keys that must not be returned to the API
+_HEAVY_KEYS = frozenset({"learning_engine"})
+
 
 def get_coordinator(hass: HomeAssistant) -> Optional[Any]:
     """Get the Smart Heating coordinator instance.
@@ -43,6 +46,9 @@ async def call_maybe_async(func: callable, /, *args, **kwargs) -> Any:
     result. This is a safe helper to call possibly-mocked async functions
     in tests where MagicMock may be used.
     """
+    # One isawaitable check on the result covers sync and async callables.
+    # An up-front iscoroutinefunction check would add work to the sync path,
+    # and caching it would keep the bound methods and mocks passed in alive.
     result = func(*args, **kwargs)
     if inspect.isawaitable(result):
         return await result
@@ -77,6 +83,8 @@ def safe_coordinator_data(data: dict[str, Any]) -> dict[str, Any]:
     """Remove learning_engine from coordinator data before returning to API.
 
     The learning_engine contains circular references and is too large for JSON.
+    Only top-level keys are stripped; the remaining values are shared with the
+    coordinator data, not copied.
 
     Args:
         data: Coordinator data dictionary
@@ -84,4 +92,4 @@ def safe_coordinator_data(data: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Filtered data dictionary
     """
-    return {k: v for k, v in data.items() if k != "learning_engine"}
+    return {k: v for k, v in data.items() if k not in _HEAVY_KEYS}
@@ -91,33 +91,46 @@ class DeviceRegistry:
         Returns:
             True if device should be filtered
         """
+        hidden_names = _lower_area_names(hidden_areas)
+        if not hidden_names:
+            return False
+
+        # Check if HA area matches hidden area
+        if ha_area_name and ha_area_name.lower() in hidden_names:
+            _LOGGER.debug(
+                "Filtering device %s - HA area %s matches hidden area",
+                entity_id,
+                ha_area_name,
+            )
+            return True
+
+        # Check if entity name contains hidden area name
         entity_id_lower = entity_id.lower()
         friendly_name_lower = friendly_name.lower()
-
-        for hidden_area in hidden_areas:
-            area_name_lower = hidden_area["name"].lower()
-
-            # Check if entity name contains hidden area name
+        for area_name_lower in hidden_names:
             if area_name_lower in entity_id_lower or area_name_lower in friendly_name_lower:
                 _LOGGER.debug(
                     "Filtering device %s - contains hidden area name '%s'",
                     entity_id,
-                    hidden_area["name"],
-                )
-                return True
-
-            # Check if HA area matches hidden area
-            if ha_area_name and ha_area_name.lower() == area_name_lower:
-                _LOGGER.debug(
-                    "Filtering device %s - HA area %s matches hidden area",
-                    entity_id,
-                    ha_area_name,
+                    area_name_lower,
                 )
                 return True
 
         return False
 
 
+def _lower_area_names(hidden_areas: list[dict[str, str]]) -> frozenset[str]:
+    """Return the lowercased names of the given hidden areas.
+
+    Args:
+        hidden_areas: List of hidden area dicts with 'id' and 'name'
+
+    Returns:
+        Set of lowercased area names
+    """
+    return frozenset(area["name"].lower() for area in hidden_areas)
+
+
 def build_device_dict(
     entity: er.RegistryEntry,
     state: Any,
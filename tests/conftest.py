@@ -474,3 +474,13 @@ def mock_retry_decorator():
         return func
 
     return decorator
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Make asyncio.sleep return immediately so retry loops never wait."""
+
+    async def _sleep(*_args, **_kwargs):
+        return None
+
+    monkeypatch.setattr("asyncio.sleep", _sleep)
@@ -0,0 +1,127 @@
+"""Lightweight fakes for Smart Heating tests.
+
+Use these instead of MagicMock where a test only reads attributes; keep
+MagicMock for objects whose calls are asserted.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+from smart_heating.const import DOMAIN
+from smart_heating.features.learning_engine import MIN_LEARNING_EVENTS
+
+# Heating-rate samples for learning engine predictions; the engine only reads
+# them, so tests can share the lists
+RATES_SUFFICIENT = [0.2] * MIN_LEARNING_EVENTS
+RATES_INSUFFICIENT = [0.1] * (MIN_LEARNING_EVENTS - 1)
+RATES_NEGLIGIBLE = [0.0001] * MIN_LEARNING_EVENTS
+
+
+@dataclass(slots=True)
+class FakeStore:
+    """In-memory stand-in for the Home Assistant Store, keeping the last save."""
+
+    hass: Any
+    version: int
+    key: str
+    data: Any = None
+    removed: bool = False
+
+    async def async_load(self) -> Any:
+        return self.data
+
+    async def async_save(self, data: Any) -> None:
+        self.data = data
+
+    async def async_remove(self) -> None:
+        self.data = None
+        self.removed = True
+
+
+@dataclass(slots=True)
+class FakeBoostManager:
+    """Boost manager exposing the attributes read by the state builder."""
+
+    boost_mode_active: bool = False
+    boost_temp: float = 23.0
+    boost_duration: int = 60
+    night_boost_enabled: bool = True
+    night_boost_offset: float = 0.5
+    night_boost_start_time: str = "22:00"
+    night_boost_end_time: str = "06:00"
+    smart_boost_enabled: bool = False
+    smart_boost_target_time: str = "06:00"
+    weather_entity_id: str | None = None
+    proactive_maintenance_enabled: bool = False
+    proactive_maintenance_sensitivity: float = 1.0
+    proactive_maintenance_min_trend: float = -0.1
+    proactive_maintenance_margin_minutes: int = 30
+    proactive_maintenance_cooldown_minutes: int = 60
+
+
+@dataclass(slots=True)
+class FakeArea:
+    """Area exposing the attributes read when building coordinator data."""
+
+    area_id: str = "living_room"
+    name: str = "Living Room"
+    enabled: bool = True
+    state: str = "heat"
+    target_temperature: float = 21.0
+    effective_target_temperature: float = 21.0
+    current_temperature: float | None = 20.0
+    devices: dict[str, dict[str, Any]] = field(default_factory=dict)
+    schedules: dict[str, Any] = field(default_factory=dict)
+    preset_mode: str = "comfort"
+    away_temp: float = 16.0
+    eco_temp: float = 18.0
+    comfort_temp: float = 21.0
+    home_temp: float = 20.0
+    sleep_temp: float = 17.0
+    activity_temp: float = 22.0
+    use_global_away: bool = True
+    use_global_eco: bool = True
+    use_global_comfort: bool = True
+    use_global_home: bool = True
+    use_global_sleep: bool = True
+    use_global_activity: bool = True
+    use_global_presence: bool = True
+    hvac_mode: str = "heat"
+    hysteresis_override: float | None = None
+    manual_override: bool = False
+    hidden: bool = False
+    shutdown_switches_when_idle: bool = True
+    window_sensors: list[Any] = field(default_factory=list)
+    presence_sensors: list[Any] = field(default_factory=list)
+    primary_temperature_sensor: str | None = None
+    trv_entities: list[dict[str, Any]] = field(default_factory=list)
+    boost_manager: FakeBoostManager = field(default_factory=FakeBoostManager)
+
+    def get_effective_target_temperature(self) -> float:
+        """Return the configured effective target temperature."""
+        return self.effective_target_temperature
+
+
+def fake_hass(
+    entity_ids: Iterable[str] = (), get: Callable[[str], Any] | None = None
+) -> SimpleNamespace:
+    """Build a hass stub exposing the state lookups the learning engine makes.
+
+    Tests may replace ``states.get`` / ``states.async_entity_ids`` with plain
+    functions; only ``async_create_task`` is a mock, closing the coroutine it
+    is given, so scheduling can be asserted.
+    """
+    states = SimpleNamespace(
+        async_entity_ids=lambda _domain=None: list(entity_ids),
+        get=get or (lambda _entity_id: None),
+    )
+    return SimpleNamespace(
+        data={DOMAIN: {}},
+        states=states,
+        async_create_task=MagicMock(side_effect=lambda coro: coro.close()),
+    )
@@ -2,15 +2,65 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from contextlib import suppress
+from unittest.mock import AsyncMock, MagicMock, create_autospec, patch
 
 import pytest
 from homeassistant.core import HomeAssistant, State
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from smart_heating.climate.climate_controller import ClimateController
+from smart_heating.climate.device_control import DeviceControlHandler
 from smart_heating.const import DOMAIN, STATE_INITIALIZED, UPDATE_INTERVAL
 from smart_heating.core.coordinator import SmartHeatingCoordinator
 
 from tests.unit.const import TEST_AREA_ID
+from tests.unit.fakes import FakeArea, FakeBoostManager
+
+
+def make_fake_task() -> asyncio.Future:
+    """Return a pending future standing in for a scheduled task.
+
+    Task-collection helpers only call ``cancel()``, so a bare future avoids
+    scheduling a coroutine on the loop.
+    """
+    return asyncio.get_running_loop().create_future()
+
+
+def install_area(coordinator: SmartHeatingCoordinator, area, area_id: str = TEST_AREA_ID) -> None:
+    """Make ``area`` the only area returned by the mocked area manager."""
+    coordinator.area_manager.get_all_areas.return_value = {area_id: area}
+    coordinator.area_manager.get_area.return_value = area
+
+
+@pytest.fixture(scope="session")
+def climate_controller_spec() -> MagicMock:
+    """Build an autospecced ClimateController once per test session."""
+    controller = create_autospec(ClimateController, instance=True)
+    controller.device_handler = create_autospec(DeviceControlHandler, instance=True)
+    return controller
+
+
+@pytest.fixture
+def mock_climate_controller(climate_controller_spec: MagicMock) -> MagicMock:
+    """Return the shared climate controller mock with calls and stubbed results cleared.
+
+    Resetting return values and side effects too keeps one test's stubs from
+    leaking into the next through the session-scoped spec.
+    """
+    climate_controller_spec.reset_mock(return_value=True, side_effect=True)
+    return climate_controller_spec
+
+
+@pytest.fixture
+def installed_controller(
+    hass: HomeAssistant, mock_climate_controller: MagicMock, monkeypatch
+) -> MagicMock:
+    """Register the mock climate controller in hass.data for the current test."""
+    hass.data.setdefault(DOMAIN, {})
+    monkeypatch.setitem(hass.data[DOMAIN], "climate_controller", mock_climate_controller)
+    return mock_climate_controller
 
 
 @pytest.fixture
@@ -62,7 +112,7 @@ class TestCoordinatorSetup:
         """Test setup with devices."""
         mock_area = MagicMock()
         mock_area.devices = {"climate.test": {"type": "thermostat"}}
-        coordinator.area_manager.get_all_areas.return_value = {TEST_AREA_ID: mock_area}
+        install_area(coordinator, mock_area)
 
         with patch("smart_heating.core.coordinator.async_track_state_change_event") as mock_track:
             mock_track.return_value = MagicMock()
@@ -91,49 +141,9 @@ class TestCoordinatorDataUpdate:
     ):
         """Test successful data update."""
         # Create mock area with proper attributes
-        mock_area = MagicMock()
-        mock_area.area_id = TEST_AREA_ID
-        mock_area.name = "Living Room"
-        mock_area.enabled = True
-        mock_area.state = "heat"
-        mock_area.target_temperature = 21.0
-        mock_area.current_temperature = 20.0
-        mock_area.devices = {}
-        mock_area.schedules = {}
-        mock_area.preset_mode = "comfort"
-        mock_area.away_temp = 16.0
-        mock_area.eco_temp = 18.0
-        mock_area.comfort_temp = 21.0
-        mock_area.home_temp = 20.0
-        mock_area.sleep_temp = 17.0
-        mock_area.activity_temp = 22.0
-        mock_area.use_global_away = True
-        mock_area.use_global_eco = True
-        mock_area.use_global_comfort = True
-        mock_area.use_global_home = True
-        mock_area.use_global_sleep = True
-        mock_area.use_global_activity = True
-        mock_area.use_global_presence = True
-        mock_area.boost_manager.boost_mode_active = False
-        mock_area.boost_manager.boost_temp = 23.0
-        mock_area.boost_manager.boost_duration = 60
-        mock_area.hvac_mode = "heat"
-        mock_area.hysteresis_override = None
-        mock_area.manual_override = False
-        mock_area.hidden = False
-        mock_area.shutdown_switches_when_idle = True
-        mock_area.window_sensors = []
-        mock_area.presence_sensors = []
-        mock_area.boost_manager.night_boost_enabled = True
-        mock_area.boost_manager.night_boost_offset = 0.5
-        mock_area.boost_manager.night_boost_start_time = "22:00"
-        mock_area.boost_manager.night_boost_end_time = "06:00"
-        mock_area.boost_manager.smart_boost_enabled = False
-        mock_area.boost_manager.smart_boost_target_time = "06:00"
-        mock_area.boost_manager.weather_entity_id = None
-        mock_area.get_effective_target_temperature.return_value = 21.0
-
-        coordinator.area_manager.get_all_areas.return_value = {TEST_AREA_ID: mock_area}
+        mock_area = FakeArea()
+
+        install_area(coordinator, mock_area)
 
         data = await coordinator._async_update_data()
 
@@ -154,53 +164,30 @@ class TestCoordinatorDataUpdate:
         assert data["area_count"] == 0
         assert data["areas"] == {}
 
+    async def test_async_update_data_includes_consumption_defaults(
+        self, coordinator: SmartHeatingCoordinator
+    ):
+        """Test a consumption settings change produces different data."""
+        coordinator.area_manager.get_all_areas.return_value = {}
+        coordinator.area_manager.default_min_consumption = 0.5
+        coordinator.area_manager.default_max_consumption = 2.0
+
+        first = await coordinator._async_update_data()
+        coordinator.area_manager.default_max_consumption = 3.0
+        second = await coordinator._async_update_data()
+
+        assert first["default_min_consumption"] == 0.5
+        assert first["default_max_consumption"] == 2.0
+        assert second["default_max_consumption"] == 3.0
+        assert first != second
+
     async def test_async_update_data_with_thermostat(
         self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
     ):
         """Test data update includes thermostat device states."""
-        mock_area = MagicMock()
-        mock_area.area_id = TEST_AREA_ID
-        mock_area.name = "Living Room"
-        mock_area.enabled = True
-        mock_area.state = "heat"
-        mock_area.target_temperature = 21.0
-        mock_area.current_temperature = 20.0
-        mock_area.devices = {"climate.test": {"type": "thermostat"}}
-        mock_area.schedules = {}
-        mock_area.preset_mode = "comfort"
-        mock_area.away_temp = 16.0
-        mock_area.eco_temp = 18.0
-        mock_area.comfort_temp = 21.0
-        mock_area.home_temp = 20.0
-        mock_area.sleep_temp = 17.0
-        mock_area.activity_temp = 22.0
-        mock_area.use_global_away = True
-        mock_area.use_global_eco = True
-        mock_area.use_global_comfort = True
-        mock_area.use_global_home = True
-        mock_area.use_global_sleep = True
-        mock_area.use_global_activity = True
-        mock_area.use_global_presence = True
-        mock_area.boost_manager.boost_mode_active = False
-        mock_area.boost_manager.boost_temp = 23.0
-        mock_area.boost_manager.boost_duration = 60
-        mock_area.hvac_mode = "heat"
-        mock_area.hysteresis_override = None
-        mock_area.manual_override = False
-        mock_area.hidden = False
-        mock_area.shutdown_switches_when_idle = True
-        mock_area.window_sensors = []
-        mock_area.presence_sensors = []
-        mock_area.boost_manager.night_boost_enabled = True
-        mock_area.boost_manager.night_boost_offset = 0.5
-        mock_area.boost_manager.night_boost_start_time = "22:00"
-        mock_area.boost_manager.night_boost_end_time = "06:00"
-        mock_area.boost_manager.smart_boost_enabled = False
-        mock_area.boost_manager.smart_boost_target_time = "06:00"
-        mock_area.boost_manager.weather_entity_id = None
-        mock_area.get_effective_target_temperature.return_value = 21.0
-
-        coordinator.area_manager.get_all_areas.return_value = {TEST_AREA_ID: mock_area}
+        mock_area = FakeArea(devices={"climate.test": {"type": "thermostat"}})
+
+        install_area(coordinator, mock_area)
 
         # Create actual state in hass
         hass.states.async_set(
@@ -239,30 +226,12 @@ class TestCoordinatorDataUpdate:
     ):
         """Test that temperature is recorded to temperature tracker during update."""
         # Create mock area with temperature
-        mock_area = MagicMock()
-        mock_area.area_id = TEST_AREA_ID
-        mock_area.name = "Living Room"
-        mock_area.enabled = True
-        mock_area.state = "heat"
-        mock_area.current_temperature = 19.5
-        mock_area.target_temperature = 21.0
-        mock_area.devices = {}
-        mock_area.schedules = {}
-        mock_area.preset_mode = "comfort"
-        mock_area.boost_manager.boost_mode_active = False
-        mock_area.hvac_mode = "heat"
-        mock_area.hysteresis_override = None
-        mock_area.manual_override = False
-        mock_area.hidden = False
-        mock_area.shutdown_switches_when_idle = True
-        mock_area.window_sensors = []
-        mock_area.presence_sensors = []
-        mock_area.boost_manager.night_boost_enabled = False
-        mock_area.boost_manager.smart_boost_enabled = False
-        mock_area.boost_manager.weather_entity_id = None
-        mock_area.get_effective_target_temperature.return_value = 21.0
-
-        coordinator.area_manager.get_all_areas.return_value = {TEST_AREA_ID: mock_area}
+        mock_area = FakeArea(
+            current_temperature=19.5,
+            boost_manager=FakeBoostManager(night_boost_enabled=False),
+        )
+
+        install_area(coordinator, mock_area)
 
         # Verify temperature tracker is empty before update
         assert coordinator._temperature_tracker.get_latest_temperature(TEST_AREA_ID) is None
@@ -284,6 +253,38 @@ class TestCoordinatorDataUpdate:
         assert trend is not None
 
 
+class TestAreaDataReuse:
+    """Test reuse of unchanged area payloads between refreshes."""
+
+    def test_unchanged_area_data_returns_previous_object(
+        self, coordinator: SmartHeatingCoordinator
+    ):
+        """Test an identical payload is replaced by the previous object."""
+        first = coordinator._reuse_unchanged_area_data(TEST_AREA_ID, {"target_temperature": 21.0})
+        second = coordinator._reuse_unchanged_area_data(TEST_AREA_ID, {"target_temperature": 21.0})
+
+        assert second is first
+
+    def test_changed_area_data_replaces_previous(self, coordinator: SmartHeatingCoordinator):
+        """Test a changed payload is returned and remembered."""
+        coordinator._reuse_unchanged_area_data(TEST_AREA_ID, {"target_temperature": 21.0})
+        changed = {"target_temperature": 22.0}
+
+        result = coordinator._reuse_unchanged_area_data(TEST_AREA_ID, changed)
+
+        assert result is changed
+        assert coordinator._last_area_data[TEST_AREA_ID] is changed
+
+    async def test_removed_areas_are_forgotten(self, coordinator: SmartHeatingCoordinator):
+        """Test payloads of areas that no longer exist are dropped on refresh."""
+        coordinator._last_area_data["removed_area"] = {"name": "Old"}
+        coordinator.area_manager.get_all_areas.return_value = {}
+
+        await coordinator._async_update_data()
+
+        assert coordinator._last_area_data == {}
+
+
 class TestStateChangeHandling:
     """Test state change event handling."""
 
@@ -308,9 +309,7 @@ class TestStateChangeHandling:
             "new_state": mock_new_state,
         }
 
-        import asyncio as _asyncio
-
-        orig = _asyncio.create_task
+        orig = asyncio.create_task
         with patch("smart_heating.core.coordinator.asyncio.create_task") as mock_create_task:
             mock_create_task.side_effect = lambda coro, orig=orig: orig(coro)
             coordinator._handle_state_change(event)
@@ -342,9 +341,7 @@ class TestStateChangeHandling:
             "new_state": mock_new_state,
         }
 
-        import asyncio as _asyncio
-
-        orig = _asyncio.create_task
+        orig = asyncio.create_task
         with patch("smart_heating.core.coordinator.asyncio.create_task") as mock_create_task:
             mock_create_task.side_effect = lambda coro, orig=orig: orig(coro)
             coordinator._handle_state_change(event)
@@ -384,9 +381,7 @@ class TestStateChangeHandling:
             "new_state": mock_new_state,
         }
 
-        import asyncio as _asyncio
-
-        orig = _asyncio.create_task
+        orig = asyncio.create_task
         with patch("smart_heating.core.coordinator.asyncio.create_task") as mock_create_task:
             mock_create_task.side_effect = lambda coro, orig=orig: orig(coro)
             coordinator._handle_state_change(event)
@@ -426,9 +421,7 @@ class TestStateChangeHandling:
             "new_state": mock_new_state,
         }
 
-        import asyncio as _asyncio
-
-        orig = _asyncio.create_task
+        orig = asyncio.create_task
         with patch("smart_heating.core.coordinator.asyncio.create_task") as mock_create_task:
             mock_create_task.side_effect = lambda coro, orig=orig: orig(coro)
             coordinator._handle_state_change(event)
@@ -445,8 +438,6 @@ class TestStateChangeHandling:
         self, coordinator: SmartHeatingCoordinator
     ):
         """Test that target temperature changes are debounced."""
-        import asyncio
-
         mock_old_state = MagicMock()
         mock_old_state.state = "heat"
         mock_old_state.attributes = {
@@ -486,49 +477,9 @@ class TestCoordinatorDeviceUpdates:
     ):
         """Test updating device state in coordinator data."""
         # Create mock area with thermostat device
-        mock_area = MagicMock()
-        mock_area.area_id = TEST_AREA_ID
-        mock_area.name = "Living Room"
-        mock_area.enabled = True
-        mock_area.state = "heat"
-        mock_area.target_temperature = 21.0
-        mock_area.current_temperature = 20.0
-        mock_area.devices = {"climate.test": {"type": "thermostat"}}
-        mock_area.schedules = {}
-        mock_area.preset_mode = "comfort"
-        mock_area.away_temp = 16.0
-        mock_area.eco_temp = 18.0
-        mock_area.comfort_temp = 21.0
-        mock_area.home_temp = 20.0
-        mock_area.sleep_temp = 17.0
-        mock_area.activity_temp = 22.0
-        mock_area.use_global_away = True
-        mock_area.use_global_eco = True
-        mock_area.use_global_comfort = True
-        mock_area.use_global_home = True
-        mock_area.use_global_sleep = True
-        mock_area.use_global_activity = True
-        mock_area.use_global_presence = True
-        mock_area.boost_manager.boost_mode_active = False
-        mock_area.boost_manager.boost_temp = 23.0
-        mock_area.boost_manager.boost_duration = 60
-        mock_area.hvac_mode = "heat"
-        mock_area.hysteresis_override = None
-        mock_area.manual_override = False
-        mock_area.hidden = False
-        mock_area.shutdown_switches_when_idle = True
-        mock_area.window_sensors = []
-        mock_area.presence_sensors = []
-        mock_area.boost_manager.night_boost_enabled = True
-        mock_area.boost_manager.night_boost_offset = 0.5
-        mock_area.boost_manager.night_boost_start_time = "22:00"
-        mock_area.boost_manager.night_boost_end_time = "06:00"
-        mock_area.boost_manager.smart_boost_enabled = False
-        mock_area.boost_manager.smart_boost_target_time = "06:00"
-        mock_area.boost_manager.weather_entity_id = None
-        mock_area.get_effective_target_temperature.return_value = 21.0
-
-        coordinator.area_manager.get_all_areas.return_value = {TEST_AREA_ID: mock_area}
+        mock_area = FakeArea(devices={"climate.test": {"type": "thermostat"}})
+
+        install_area(coordinator, mock_area)
 
         # Set device state in hass
         hass.states.async_set(
@@ -552,54 +503,12 @@ class TestCoordinatorDeviceUpdates:
         assert len(devices) == 1
         assert devices[0]["state"] == "heat"
 
-    async def test_handle_unavailable_device(
-        self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
-    ):
+    async def test_handle_unavailable_device(self, coordinator: SmartHeatingCoordinator):
         """Test handling unavailable devices."""
         # Create mock area with device
-        mock_area = MagicMock()
-        mock_area.area_id = TEST_AREA_ID
-        mock_area.name = "Living Room"
-        mock_area.enabled = True
-        mock_area.state = "heat"
-        mock_area.target_temperature = 21.0
-        mock_area.current_temperature = 20.0
-        mock_area.devices = {"climate.unavailable": {"type": "thermostat"}}
-        mock_area.schedules = {}
-        mock_area.preset_mode = "comfort"
-        mock_area.away_temp = 16.0
-        mock_area.eco_temp = 18.0
-        mock_area.comfort_temp = 21.0
-        mock_area.home_temp = 20.0
-        mock_area.sleep_temp = 17.0
-        mock_area.activity_temp = 22.0
-        mock_area.use_global_away = True
-        mock_area.use_global_eco = True
-        mock_area.use_global_comfort = True
-        mock_area.use_global_home = True
-        mock_area.use_global_sleep = True
-        mock_area.use_global_activity = True
-        mock_area.use_global_presence = True
-        mock_area.boost_manager.boost_mode_active = False
-        mock_area.boost_manager.boost_temp = 23.0
-        mock_area.boost_manager.boost_duration = 60
-        mock_area.hvac_mode = "heat"
-        mock_area.hysteresis_override = None
-        mock_area.manual_override = False
-        mock_area.hidden = False
-        mock_area.shutdown_switches_when_idle = True
-        mock_area.window_sensors = []
-        mock_area.presence_sensors = []
-        mock_area.boost_manager.night_boost_enabled = True
-        mock_area.boost_manager.night_boost_offset = 0.5
-        mock_area.boost_manager.night_boost_start_time = "22:00"
-        mock_area.boost_manager.night_boost_end_time = "06:00"
-        mock_area.boost_manager.smart_boost_enabled = False
-        mock_area.boost_manager.smart_boost_target_time = "06:00"
-        mock_area.boost_manager.weather_entity_id = None
-        mock_area.get_effective_target_temperature.return_value = 21.0
-
-        coordinator.area_manager.get_all_areas.return_value = {TEST_AREA_ID: mock_area}
+        mock_area = FakeArea(devices={"climate.unavailable": {"type": "thermostat"}})
+
+        install_area(coordinator, mock_area)
 
         # Device state is None (unavailable)
         await coordinator.async_request_refresh()
@@ -617,49 +526,9 @@ class TestCoordinatorAreaUpdates:
 
     async def test_update_area_temperature(self, coordinator: SmartHeatingCoordinator):
         """Test updating area temperature."""
-        mock_area = MagicMock()
-        mock_area.area_id = TEST_AREA_ID
-        mock_area.name = "Living Room"
-        mock_area.enabled = True
-        mock_area.state = "heat"
-        mock_area.target_temperature = 21.0
-        mock_area.current_temperature = 20.0
-        mock_area.devices = {}
-        mock_area.schedules = {}
-        mock_area.preset_mode = "comfort"
-        mock_area.away_temp = 16.0
-        mock_area.eco_temp = 18.0
-        mock_area.comfort_temp = 21.0
-        mock_area.home_temp = 20.0
-        mock_area.sleep_temp = 17.0
-        mock_area.activity_temp = 22.0
-        mock_area.use_global_away = True
-        mock_area.use_global_eco = True
-        mock_area.use_global_comfort = True
-        mock_area.use_global_home = True
-        mock_area.use_global_sleep = True
-        mock_area.use_global_activity = True
-        mock_area.use_global_presence = True
-        mock_area.boost_manager.boost_mode_active = False
-        mock_area.boost_manager.boost_temp = 23.0
-        mock_area.boost_manager.boost_duration = 60
-        mock_area.hvac_mode = "heat"
-        mock_area.hysteresis_override = None
-        mock_area.manual_override = False
-        mock_area.hidden = False
-        mock_area.shutdown_switches_when_idle = True
-        mock_area.window_sensors = []
-        mock_area.presence_sensors = []
-        mock_area.boost_manager.night_boost_enabled = True
-        mock_area.boost_manager.night_boost_offset = 0.5
-        mock_area.boost_manager.night_boost_start_time = "22:00"
-        mock_area.boost_manager.night_boost_end_time = "06:00"
-        mock_area.boost_manager.smart_boost_enabled = False
-        mock_area.boost_manager.smart_boost_target_time = "06:00"
-        mock_area.boost_manager.weather_entity_id = None
-        mock_area.get_effective_target_temperature.return_value = 21.0
-
-        coordinator.area_manager.get_all_areas.return_value = {TEST_AREA_ID: mock_area}
+        mock_area = FakeArea()
+
+        install_area(coordinator, mock_area)
 
         await coordinator.async_request_refresh()
 
@@ -667,49 +536,9 @@ class TestCoordinatorAreaUpdates:
 
     async def test_update_area_target_temperature(self, coordinator: SmartHeatingCoordinator):
         """Test updating area target temperature."""
-        mock_area = MagicMock()
-        mock_area.area_id = TEST_AREA_ID
-        mock_area.name = "Living Room"
-        mock_area.enabled = True
-        mock_area.state = "heat"
-        mock_area.target_temperature = 22.0
-        mock_area.current_temperature = 20.0
-        mock_area.devices = {}
-        mock_area.schedules = {}
-        mock_area.preset_mode = "comfort"
-        mock_area.away_temp = 16.0
-        mock_area.eco_temp = 18.0
-        mock_area.comfort_temp = 21.0
-        mock_area.home_temp = 20.0
-        mock_area.sleep_temp = 17.0
-        mock_area.activity_temp = 22.0
-        mock_area.use_global_away = True
-        mock_area.use_global_eco = True
-        mock_area.use_global_comfort = True
-        mock_area.use_global_home = True
-        mock_area.use_global_sleep = True
-        mock_area.use_global_activity = True
-        mock_area.use_global_presence = True
-        mock_area.boost_manager.boost_mode_active = False
-        mock_area.boost_manager.boost_temp = 23.0
-        mock_area.boost_manager.boost_duration = 60
-        mock_area.hvac_mode = "heat"
-        mock_area.hysteresis_override = None
-        mock_area.manual_override = False
-        mock_area.hidden = False
-        mock_area.shutdown_switches_when_idle = True
-        mock_area.window_sensors = []
-        mock_area.presence_sensors = []
-        mock_area.boost_manager.night_boost_enabled = True
-        mock_area.boost_manager.night_boost_offset = 0.5
-        mock_area.boost_manager.night_boost_start_time = "22:00"
-        mock_area.boost_manager.night_boost_end_time = "06:00"
-        mock_area.boost_manager.smart_boost_enabled = False
-        mock_area.boost_manager.smart_boost_target_time = "06:00"
-        mock_area.boost_manager.weather_entity_id = None
-        mock_area.get_effective_target_temperature.return_value = 22.0
-
-        coordinator.area_manager.get_all_areas.return_value = {TEST_AREA_ID: mock_area}
+        mock_area = FakeArea(target_temperature=22.0, effective_target_temperature=22.0)
+
+        install_area(coordinator, mock_area)
 
         await coordinator.async_request_refresh()
 
@@ -717,49 +546,9 @@ class TestCoordinatorAreaUpdates:
 
     async def test_update_area_enabled_state(self, coordinator: SmartHeatingCoordinator):
         """Test updating area enabled state."""
-        mock_area = MagicMock()
-        mock_area.area_id = TEST_AREA_ID
-        mock_area.name = "Living Room"
-        mock_area.enabled = False
-        mock_area.state = "heat"
-        mock_area.target_temperature = 21.0
-        mock_area.current_temperature = 20.0
-        mock_area.devices = {}
-        mock_area.schedules = {}
-        mock_area.preset_mode = "comfort"
-        mock_area.away_temp = 16.0
-        mock_area.eco_temp = 18.0
-        mock_area.comfort_temp = 21.0
-        mock_area.home_temp = 20.0
-        mock_area.sleep_temp = 17.0
-        mock_area.activity_temp = 22.0
-        mock_area.use_global_away = True
-        mock_area.use_global_eco = True
-        mock_area.use_global_comfort = True
-        mock_area.use_global_home = True
-        mock_area.use_global_sleep = True
-        mock_area.use_global_activity = True
-        mock_area.use_global_presence = True
-        mock_area.boost_manager.boost_mode_active = False
-        mock_area.boost_manager.boost_temp = 23.0
-        mock_area.boost_manager.boost_duration = 60
-        mock_area.hvac_mode = "heat"
-        mock_area.hysteresis_override = None
-        mock_area.manual_override = False
-        mock_area.hidden = False
-        mock_area.shutdown_switches_when_idle = True
-        mock_area.window_sensors = []
-        mock_area.presence_sensors = []
-        mock_area.boost_manager.night_boost_enabled = True
-        mock_area.boost_manager.night_boost_offset = 0.5
-        mock_area.boost_manager.night_boost_start_time = "22:00"
-        mock_area.boost_manager.night_boost_end_time = "06:00"
-        mock_area.boost_manager.smart_boost_enabled = False
-        mock_area.boost_manager.smart_boost_target_time = "06:00"
-        mock_area.boost_manager.weather_entity_id = None
-        mock_area.get_effective_target_temperature.return_value = 21.0
-
-        coordinator.area_manager.get_all_areas.return_value = {TEST_AREA_ID: mock_area}
+        mock_area = FakeArea(enabled=False)
+
+        install_area(coordinator, mock_area)
 
         await coordinator.async_request_refresh()
 
@@ -769,12 +558,8 @@ class TestCoordinatorAreaUpdates:
 class TestDebounceTemperatureChange:
     """Test debounced temperature change handling."""
 
-    async def test_handle_temperature_change_debounce(
-        self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
-    ):
+    async def test_handle_temperature_change_debounce(self, coordinator: SmartHeatingCoordinator):
         """Test temperature change creates debounce task."""
-        import asyncio
-
         old_state = State("climate.test", "heat", {"temperature": 20.0})
         new_state = State("climate.test", "heat", {"temperature": 21.0})
 
@@ -791,14 +576,9 @@ class TestDebounceTemperatureChange:
         self, coordinator: SmartHeatingCoordinator
     ):
         """Test manual temperature change when it matches expected temperature."""
-        mock_area = MagicMock()
-        mock_area.name = "Living Room"
-        mock_area.devices = {"climate.test": {}}
-        mock_area.get_effective_target_temperature.return_value = 21.0
-        mock_area.target_temperature = 21.0
-        mock_area.manual_override = False  # Set initial value
+        mock_area = FakeArea(devices={"climate.test": {"type": "thermostat"}})
 
-        coordinator.area_manager.get_all_areas.return_value = {TEST_AREA_ID: mock_area}
+        install_area(coordinator, mock_area)
 
         # Temperature matches expected - should not set manual override
         await coordinator._apply_manual_temperature_change("climate.test", 21.0)
@@ -813,15 +593,9 @@ class TestDebounceTemperatureChange:
         # Disable grace period to allow manual override detection
         coordinator._manual_override_detector.set_startup_grace_period(False)
 
-        mock_area = MagicMock()
-        mock_area.name = "Living Room"
-        mock_area.devices = {"climate.test": {}}
-        mock_area.get_effective_target_temperature.return_value = 21.0
-        mock_area.target_temperature = 21.0
-        mock_area.manual_override = False
+        mock_area = FakeArea(devices={"climate.test": {"type": "thermostat"}})
 
-        coordinator.area_manager.get_all_areas.return_value = {TEST_AREA_ID: mock_area}
-        coordinator.area_manager.async_save = AsyncMock()
+        install_area(coordinator, mock_area)
 
         # Temperature differs - should set manual override
         await coordinator._apply_manual_temperature_change("climate.test", 23.0)
@@ -834,6 +608,11 @@ class TestDebounceTemperatureChange:
 class TestTemperatureSensorConversion:
     """Test temperature sensor data extraction and conversion."""
 
+    # Shared read-only states; State objects are immutable for these checks
+    _UNAVAILABLE = State("sensor.temp", "unavailable", {})
+    _UNKNOWN = State("sensor.temp", "unknown", {})
+    _INVALID = State("sensor.temp", "invalid", {})
+
     def test_get_temperature_from_sensor_celsius(self, coordinator: SmartHeatingCoordinator):
         """Test getting temperature from Celsius sensor."""
         state = State("sensor.temp", "20.5", {"unit_of_measurement": "°C"})
@@ -851,26 +630,13 @@ class TestTemperatureSensorConversion:
         assert result is not None
         assert abs(result - 20.0) < 0.1  # 68°F ≈ 20°C
 
-    def test_get_temperature_from_sensor_unavailable(self, coordinator: SmartHeatingCoordinator):
-        """Test getting temperature from unavailable sensor."""
-        state = State("sensor.temp", "unavailable", {})
-
-        result = coordinator._get_temperature_from_sensor("sensor.temp", state)
-
-        assert result is None
-
-    def test_get_temperature_from_sensor_unknown(self, coordinator: SmartHeatingCoordinator):
-        """Test getting temperature from unknown sensor."""
-        state = State("sensor.temp", "unknown", {})
-
-        result = coordinator._get_temperature_from_sensor("sensor.temp", state)
-
-        assert result is None
-
-    def test_get_temperature_from_sensor_invalid(self, coordinator: SmartHeatingCoordinator):
-        """Test getting temperature from sensor with invalid value."""
-        state = State("sensor.temp", "invalid", {})
-
+    @pytest.mark.parametrize(
+        "state", [_UNAVAILABLE, _UNKNOWN, _INVALID], ids=["unavailable", "unknown", "invalid"]
+    )
+    def test_get_temperature_from_sensor_no_value(
+        self, coordinator: SmartHeatingCoordinator, state: State
+    ):
+        """Test sensors without a usable numeric value return None."""
         result = coordinator._get_temperature_from_sensor("sensor.temp", state)
 
         assert result is None
@@ -879,6 +645,10 @@ class TestTemperatureSensorConversion:
 class TestValvePosition:
     """Test valve position extraction."""
 
+    _UNAVAILABLE = State("number.valve", "unavailable", {})
+    _UNKNOWN = State("number.valve", "unknown", {})
+    _INVALID = State("number.valve", "invalid", {})
+
     def test_get_valve_position_valid(self, coordinator: SmartHeatingCoordinator):
         """Test getting valid valve position."""
         state = State("number.valve", "50.0", {})
@@ -887,26 +657,11 @@ class TestValvePosition:
 
         assert result == 50.0
 
-    def test_get_valve_position_unavailable(self, coordinator: SmartHeatingCoordinator):
-        """Test getting valve position when unavailable."""
-        state = State("number.valve", "unavailable", {})
-
-        result = coordinator._get_valve_position(state)
-
-        assert result is None
-
-    def test_get_valve_position_unknown(self, coordinator: SmartHeatingCoordinator):
-        """Test getting valve position when unknown."""
-        state = State("number.valve", "unknown", {})
-
-        result = coordinator._get_valve_position(state)
-
-        assert result is None
-
-    def test_get_valve_position_invalid(self, coordinator: SmartHeatingCoordinator):
-        """Test getting valve position with invalid value."""
-        state = State("number.valve", "invalid", {})
-
+    @pytest.mark.parametrize(
+        "state", [_UNAVAILABLE, _UNKNOWN, _INVALID], ids=["unavailable", "unknown", "invalid"]
+    )
+    def test_get_valve_position_no_value(self, coordinator: SmartHeatingCoordinator, state: State):
+        """Test valves without a usable numeric position return None."""
         result = coordinator._get_valve_position(state)
 
         assert result is None
@@ -922,7 +677,6 @@ class TestGetDeviceStateData:
         device_id = "sensor.living_room_temp"
         device_info = {"type": "temperature_sensor"}
 
-        # Set state using hass.states.async_set
         hass.states.async_set(
             device_id,
             "22.5",
@@ -1006,25 +760,14 @@ class TestCoordinatorAreaOperations:
 
     @pytest.mark.asyncio
     async def test_async_enable_area_success(
-        self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
+        self, coordinator: SmartHeatingCoordinator, installed_controller: MagicMock
     ):
         """Test enabling area successfully."""
         area_id = "living_room"
 
         # Mock area manager
-        mock_area = MagicMock()
-        mock_area.current_temperature = 18.0
-        mock_area.get_effective_target_temperature.return_value = 20.0
-        coordinator.area_manager.get_area.return_value = mock_area
-        coordinator.area_manager.enable_area = MagicMock()
-        coordinator.area_manager.async_save = AsyncMock()
-
-        # Mock climate controller
-        mock_climate_controller = MagicMock()
-        mock_climate_controller.device_handler = MagicMock()
-        mock_climate_controller.device_handler.async_control_thermostats = AsyncMock()
-        mock_climate_controller.device_handler.async_control_valves = AsyncMock()
-        hass.data = {DOMAIN: {"climate_controller": mock_climate_controller}}
+        mock_area = FakeArea(effective_target_temperature=20.0, current_temperature=18.0)
+        install_area(coordinator, mock_area)
 
         # Mock coordinator refresh
         coordinator.async_request_refresh = AsyncMock()
@@ -1036,31 +779,22 @@ class TestCoordinatorAreaOperations:
         coordinator.area_manager.async_save.assert_called_once()
 
         # Verify device control calls
-        mock_climate_controller.device_handler.async_control_thermostats.assert_called_once()
-        mock_climate_controller.device_handler.async_control_valves.assert_called_once()
+        installed_controller.device_handler.async_control_thermostats.assert_called_once()
+        installed_controller.device_handler.async_control_valves.assert_called_once()
 
         # Verify coordinator refresh
         coordinator.async_request_refresh.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_async_enable_area_no_temperature(
-        self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
+        self, coordinator: SmartHeatingCoordinator, installed_controller: MagicMock
     ):
         """Test enabling area when area has no current temperature."""
         area_id = "living_room"
 
         # Mock area with no temperature
-        mock_area = MagicMock()
-        mock_area.current_temperature = None
-        coordinator.area_manager.get_area.return_value = mock_area
-        coordinator.area_manager.enable_area = MagicMock()
-        coordinator.area_manager.async_save = AsyncMock()
-
-        # Mock climate controller
-        mock_climate_controller = MagicMock()
-        mock_climate_controller.device_handler = MagicMock()
-        mock_climate_controller.device_handler.async_control_thermostats = AsyncMock()
-        hass.data = {DOMAIN: {"climate_controller": mock_climate_controller}}
+        mock_area = FakeArea(current_temperature=None)
+        install_area(coordinator, mock_area)
 
         # Mock coordinator refresh
         coordinator.async_request_refresh = AsyncMock()
@@ -1072,7 +806,7 @@ class TestCoordinatorAreaOperations:
         coordinator.area_manager.async_save.assert_called_once()
 
         # Should not call device control (no temperature)
-        mock_climate_controller.device_handler.async_control_thermostats.assert_not_called()
+        installed_controller.device_handler.async_control_thermostats.assert_not_called()
 
         # Verify coordinator refresh
         coordinator.async_request_refresh.assert_called_once()
@@ -1090,23 +824,14 @@ class TestCoordinatorAreaOperations:
 
     @pytest.mark.asyncio
     async def test_async_disable_area_success(
-        self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
+        self, coordinator: SmartHeatingCoordinator, installed_controller: MagicMock
     ):
         """Test disabling area successfully."""
         area_id = "living_room"
 
         # Mock area manager
-        mock_area = MagicMock()
-        coordinator.area_manager.get_area.return_value = mock_area
-        coordinator.area_manager.disable_area = MagicMock()
-        coordinator.area_manager.async_save = AsyncMock()
-
-        # Mock climate controller
-        mock_climate_controller = MagicMock()
-        mock_climate_controller.device_handler = MagicMock()
-        mock_climate_controller.device_handler.async_set_valves_to_off = AsyncMock()
-        mock_climate_controller.device_handler.async_control_thermostats = AsyncMock()
-        hass.data = {DOMAIN: {"climate_controller": mock_climate_controller}}
+        mock_area = FakeArea()
+        install_area(coordinator, mock_area)
 
         # Mock coordinator refresh
         coordinator.async_request_refresh = AsyncMock()
@@ -1118,10 +843,10 @@ class TestCoordinatorAreaOperations:
         coordinator.area_manager.async_save.assert_called_once()
 
         # Verify device control calls
-        mock_climate_controller.device_handler.async_set_valves_to_off.assert_called_once_with(
+        installed_controller.device_handler.async_set_valves_to_off.assert_called_once_with(
             mock_area, 0.0
         )
-        mock_climate_controller.device_handler.async_control_thermostats.assert_called_once_with(
+        installed_controller.device_handler.async_control_thermostats.assert_called_once_with(
             mock_area, False, None
         )
 
@@ -1141,20 +866,15 @@ class TestCoordinatorAreaOperations:
 
     @pytest.mark.asyncio
     async def test_async_enable_area_no_climate_controller(
-        self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
+        self, coordinator: SmartHeatingCoordinator
     ):
         """Test enabling area when climate controller is not available."""
         area_id = "living_room"
 
-        mock_area = MagicMock()
-        mock_area.current_temperature = 18.0
-        mock_area.get_effective_target_temperature.return_value = 20.0
-        coordinator.area_manager.get_area.return_value = mock_area
-        coordinator.area_manager.enable_area = MagicMock()
-        coordinator.area_manager.async_save = AsyncMock()
-
-        # No climate controller in hass.data
-        hass.data = {DOMAIN: {}}
+        mock_area = FakeArea(effective_target_temperature=20.0, current_temperature=18.0)
+        install_area(coordinator, mock_area)
+
+        # No climate controller registered in hass.data
         coordinator.async_request_refresh = AsyncMock()
 
         await coordinator.async_enable_area(area_id)
@@ -1166,18 +886,15 @@ class TestCoordinatorAreaOperations:
 
     @pytest.mark.asyncio
     async def test_async_disable_area_no_climate_controller(
-        self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
+        self, coordinator: SmartHeatingCoordinator
     ):
         """Test disabling area when climate controller is not available."""
         area_id = "living_room"
 
-        mock_area = MagicMock()
-        coordinator.area_manager.get_area.return_value = mock_area
-        coordinator.area_manager.disable_area = MagicMock()
-        coordinator.area_manager.async_save = AsyncMock()
+        mock_area = FakeArea()
+        install_area(coordinator, mock_area)
 
-        # No climate controller in hass.data
-        hass.data = {DOMAIN: {}}
+        # No climate controller registered in hass.data
         coordinator.async_request_refresh = AsyncMock()
 
         await coordinator.async_disable_area(area_id)
@@ -1212,11 +929,8 @@ class TestGracePeriod:
         """Test that manual temp changes are ignored during grace period."""
         coordinator._startup_grace_period = True
 
-        mock_area = MagicMock()
-        mock_area.name = "Living Room"
-        mock_area.devices = {"climate.test": {}}
-        mock_area.manual_override = False
-        coordinator.area_manager.get_all_areas.return_value = {TEST_AREA_ID: mock_area}
+        mock_area = FakeArea(devices={"climate.test": {"type": "thermostat"}})
+        install_area(coordinator, mock_area)
 
         await coordinator._apply_manual_temperature_change("climate.test", 23.0)
 
@@ -1230,11 +944,8 @@ class TestGracePeriod:
         """Test that None temperature is ignored."""
         coordinator._startup_grace_period = False
 
-        mock_area = MagicMock()
-        mock_area.name = "Living Room"
-        mock_area.devices = {"climate.test": {}}
-        mock_area.manual_override = False
-        coordinator.area_manager.get_all_areas.return_value = {TEST_AREA_ID: mock_area}
+        mock_area = FakeArea(devices={"climate.test": {"type": "thermostat"}})
+        install_area(coordinator, mock_area)
 
         await coordinator._apply_manual_temperature_change("climate.test", None)
 
@@ -1248,12 +959,8 @@ class TestGracePeriod:
         """Test that lower temperature (stale state) is ignored."""
         coordinator._startup_grace_period = False
 
-        mock_area = MagicMock()
-        mock_area.name = "Living Room"
-        mock_area.devices = {"climate.test": {}}
-        mock_area.get_effective_target_temperature.return_value = 21.0
-        mock_area.manual_override = False
-        coordinator.area_manager.get_all_areas.return_value = {TEST_AREA_ID: mock_area}
+        mock_area = FakeArea(devices={"climate.test": {"type": "thermostat"}})
+        install_area(coordinator, mock_area)
 
         # Temperature is lower than expected (stale state from old preset)
         await coordinator._apply_manual_temperature_change("climate.test", 18.0)
@@ -1268,7 +975,6 @@ class TestTaskCancellation:
     @pytest.mark.asyncio
     async def test_cancel_task_if_exists_with_task(self, coordinator: SmartHeatingCoordinator):
         """Test cancelling an existing task."""
-        import asyncio
 
         # Create a dummy task
         async def dummy():
@@ -1280,10 +986,11 @@ class TestTaskCancellation:
         coordinator._cancel_task_if_exists("_test_task")
 
         # Wait for cancellation to complete
-        await asyncio.sleep(0.01)
+        with suppress(asyncio.CancelledError):
+            await task
 
         # Task should be cancelled and attribute set to None
-        assert task.cancelled() or task.done()
+        assert task.cancelled()
         assert coordinator._test_task is None
 
     @pytest.mark.asyncio
@@ -1295,38 +1002,32 @@ class TestTaskCancellation:
     @pytest.mark.asyncio
     async def test_cancel_task_collection_dict(self, coordinator: SmartHeatingCoordinator):
         """Test cancelling task collection (dict)."""
-        import asyncio
-
-        async def dummy():
-            await asyncio.sleep(10)
-
         tasks = {
-            "task1": asyncio.create_task(dummy()),
-            "task2": asyncio.create_task(dummy()),
+            "task1": make_fake_task(),
+            "task2": make_fake_task(),
         }
+        pending = list(tasks.values())
 
         coordinator._cancel_task_collection(tasks)
 
         # All tasks should be cancelled and dict cleared
         assert len(tasks) == 0
+        assert all(t.cancelled() for t in pending)
 
     @pytest.mark.asyncio
     async def test_cancel_task_collection_set(self, coordinator: SmartHeatingCoordinator):
         """Test cancelling task collection (set)."""
-        import asyncio
-
-        async def dummy():
-            await asyncio.sleep(10)
-
         tasks = {
-            asyncio.create_task(dummy()),
-            asyncio.create_task(dummy()),
+            make_fake_task(),
+            make_fake_task(),
         }
+        pending = list(tasks)
 
         coordinator._cancel_task_collection(tasks)
 
         # All tasks should be cancelled and set cleared
         assert len(tasks) == 0
+        assert all(t.cancelled() for t in pending)
 
 
 class TestDebounceTaskCancellation:
@@ -1338,7 +1039,7 @@ class TestDebounceTaskCancellation:
     )
     @pytest.mark.asyncio
     async def test_multiple_temperature_changes_cancel_previous(
-        self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
+        self, coordinator: SmartHeatingCoordinator
     ):
         """Test that multiple rapid temperature changes are debounced.
 
@@ -1417,83 +1118,56 @@ class TestWeatherStateData:
 
         assert result is None
 
-
-class TestOpenThermGateway:
-    """Test OpenTherm gateway state data."""
-
-    def test_get_opentherm_gateway_state_valid(
-        self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
-    ):
-        """Test getting valid OpenTherm gateway state."""
-        gateway_id = "climate.opentherm_gateway"
-
-        hass.states.async_set(
-            gateway_id,
-            "heat",
-            {
-                "relative_mod_level": 75.5,
-                "flame_on": True,
-            },
-        )
-
-        result = coordinator._get_opentherm_gateway_state(gateway_id)
-
-        assert result is not None
-        assert result["entity_id"] == gateway_id
-        assert result["state"] == "heat"
-        assert result["modulation_level"] == 75.5
-        assert "attributes" in result
-
-    def test_get_opentherm_gateway_state_modulation_level_attr(
+    def test_get_weather_state_data_cached_until_state_updates(
         self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
     ):
-        """Test getting OpenTherm gateway with alternative modulation attribute."""
-        gateway_id = "climate.opentherm_gateway"
-
-        hass.states.async_set(
-            gateway_id,
-            "heat",
-            {
-                "modulation_level": 50.0,  # Alternative attribute name
-            },
-        )
-
-        result = coordinator._get_opentherm_gateway_state(gateway_id)
+        """Test weather data is reused until the weather state changes."""
+        weather_entity = "weather.home"
+        hass.states.async_set(weather_entity, "10.5", {"humidity": 75})
 
-        assert result is not None
-        assert result["modulation_level"] == 50.0
+        first = coordinator._get_weather_state_data(weather_entity)
+        assert coordinator._get_weather_state_data(weather_entity) is first
 
-    def test_get_opentherm_gateway_state_no_modulation(
-        self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
-    ):
-        """Test getting OpenTherm gateway without modulation level."""
-        gateway_id = "climate.opentherm_gateway"
+        hass.states.async_set(weather_entity, "12.0", {"humidity": 70})
+        updated = coordinator._get_weather_state_data(weather_entity)
 
-        hass.states.async_set(gateway_id, "heat", {})
+        assert updated is not first
+        assert updated["temperature"] == 12.0
+        assert updated["attributes"]["humidity"] == 70
 
-        result = coordinator._get_opentherm_gateway_state(gateway_id)
 
-        assert result is not None
-        assert result["modulation_level"] is None
+class TestOpenThermGateway:
+    """Test OpenTherm gateway state data."""
 
-    def test_get_opentherm_gateway_state_invalid_modulation(
-        self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
+    @pytest.mark.parametrize(
+        ("attributes", "expected_modulation"),
+        [
+            ({"relative_mod_level": 75.5, "flame_on": True}, 75.5),
+            ({"modulation_level": 50.0}, 50.0),  # Alternative attribute name
+            ({}, None),
+            ({"relative_mod_level": "invalid"}, None),
+        ],
+        ids=["relative_mod_level", "modulation_level", "no_modulation", "invalid_modulation"],
+    )
+    def test_get_opentherm_gateway_state(
+        self,
+        coordinator: SmartHeatingCoordinator,
+        hass: HomeAssistant,
+        attributes: dict,
+        expected_modulation: float | None,
     ):
-        """Test getting OpenTherm gateway with invalid modulation value."""
+        """Test modulation level extraction from OpenTherm gateway attributes."""
         gateway_id = "climate.opentherm_gateway"
 
-        hass.states.async_set(
-            gateway_id,
-            "heat",
-            {
-                "relative_mod_level": "invalid",
-            },
-        )
+        hass.states.async_set(gateway_id, "heat", attributes)
 
         result = coordinator._get_opentherm_gateway_state(gateway_id)
 
         assert result is not None
-        assert result["modulation_level"] is None
+        assert result["entity_id"] == gateway_id
+        assert result["state"] == "heat"
+        assert result["modulation_level"] == expected_modulation
+        assert result["attributes"] == attributes
 
     def test_get_opentherm_gateway_state_no_entity(self, coordinator: SmartHeatingCoordinator):
         """Test getting OpenTherm gateway when entity ID is None."""
@@ -1511,109 +1185,51 @@ class TestOpenThermGateway:
 class TestTRVStates:
     """Test TRV state collection."""
 
-    def test_get_trv_states_for_area_binary_sensor(
-        self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
-    ):
-        """Test getting TRV states with binary sensor."""
-        mock_area = MagicMock()
-        mock_area.trv_entities = [{"entity_id": "binary_sensor.trv1"}]
-
-        hass.states.async_set("binary_sensor.trv1", "on", {})
-
-        result = coordinator._get_trv_states_for_area(mock_area)
-
-        assert len(result) == 1
-        assert result[0]["entity_id"] == "binary_sensor.trv1"
-        assert result[0]["open"] is True
-        assert result[0]["position"] is None
-
-    def test_get_trv_states_for_area_binary_sensor_off(
-        self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
-    ):
-        """Test getting TRV states with binary sensor off."""
-        mock_area = MagicMock()
-        mock_area.trv_entities = [{"entity_id": "binary_sensor.trv1"}]
-
-        hass.states.async_set("binary_sensor.trv1", "off", {})
-
-        result = coordinator._get_trv_states_for_area(mock_area)
-
-        assert len(result) == 1
-        assert result[0]["open"] is False
-
-    def test_get_trv_states_for_area_sensor_with_position(
-        self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
-    ):
-        """Test getting TRV states with position sensor."""
-        mock_area = MagicMock()
-        mock_area.trv_entities = [{"entity_id": "sensor.trv1"}]
-        mock_area.state = "heating"
-
-        hass.states.async_set("sensor.trv1", "50.0", {})
-
-        result = coordinator._get_trv_states_for_area(mock_area)
-
-        assert len(result) == 1
-        assert result[0]["entity_id"] == "sensor.trv1"
-        assert result[0]["position"] == 50.0
-        assert result[0]["running_state"] == "heating"
-
-    def test_get_trv_states_for_area_with_position_attribute(
-        self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
+    @pytest.mark.parametrize(
+        ("entity_id", "state_value", "attributes", "expected_open", "expected_position"),
+        [
+            ("binary_sensor.trv1", "on", {}, True, None),
+            ("binary_sensor.trv1", "off", {}, False, None),
+            ("sensor.trv1", "50.0", {}, None, 50.0),
+            # State value can't be converted to float, so attributes are checked
+            ("sensor.trv1", "heating", {"position": 75.0}, None, 75.0),
+            ("sensor.trv1", "heating", {"valve_position": 60.0}, None, 60.0),
+            ("sensor.trv1", "unavailable", {}, None, None),
+        ],
+        ids=[
+            "binary_sensor_on",
+            "binary_sensor_off",
+            "sensor_with_position",
+            "position_attribute",
+            "valve_position_attribute",
+            "unavailable",
+        ],
+    )
+    def test_get_trv_states_for_area(
+        self,
+        coordinator: SmartHeatingCoordinator,
+        hass: HomeAssistant,
+        entity_id: str,
+        state_value: str,
+        attributes: dict,
+        expected_open: bool | None,
+        expected_position: float | None,
     ):
-        """Test getting TRV states with position in attributes."""
-        mock_area = MagicMock()
-        mock_area.trv_entities = [{"entity_id": "sensor.trv1"}]
-
-        # State value can't be converted to float, so it will check attributes
-        hass.states.async_set(
-            "sensor.trv1",
-            "heating",
-            {
-                "position": 75.0,
-            },
-        )
+        """Test TRV state extraction for a single configured entity."""
+        area = FakeArea(trv_entities=[{"entity_id": entity_id}], state="heating")
 
-        result = coordinator._get_trv_states_for_area(mock_area)
+        hass.states.async_set(entity_id, state_value, attributes)
 
-        assert len(result) == 1
-        assert result[0]["position"] == 75.0
+        result = coordinator._get_trv_states_for_area(area)
 
-    def test_get_trv_states_for_area_with_valve_position_attribute(
-        self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
-    ):
-        """Test getting TRV states with valve_position in attributes."""
-        mock_area = MagicMock()
-        mock_area.trv_entities = [{"entity_id": "sensor.trv1"}]
-
-        # State value can't be converted to float, so it will check attributes
-        hass.states.async_set(
-            "sensor.trv1",
-            "heating",
+        assert result == [
             {
-                "valve_position": 60.0,
-            },
-        )
-
-        result = coordinator._get_trv_states_for_area(mock_area)
-
-        assert len(result) == 1
-        assert result[0]["position"] == 60.0
-
-    def test_get_trv_states_for_area_unavailable(
-        self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
-    ):
-        """Test getting TRV states when unavailable."""
-        mock_area = MagicMock()
-        mock_area.trv_entities = [{"entity_id": "sensor.trv1"}]
-
-        hass.states.async_set("sensor.trv1", "unavailable", {})
-
-        result = coordinator._get_trv_states_for_area(mock_area)
-
-        assert len(result) == 1
-        assert result[0]["position"] is None
-        assert result[0]["open"] is None
+                "entity_id": entity_id,
+                "open": expected_open,
+                "position": expected_position,
+                "running_state": "heating",
+            }
+        ]
 
     def test_get_trv_states_for_area_no_entity_id(self, coordinator: SmartHeatingCoordinator):
         """Test getting TRV states with missing entity_id."""
@@ -1655,6 +1271,36 @@ class TestTRVStates:
         assert result[1]["entity_id"] == "sensor.trv2"
         assert result[1]["position"] == 75.0
 
+    async def test_track_trv_entities_follows_state_changes(
+        self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
+    ):
+        """Test TRV values are seeded once and then updated by state change events."""
+        shared = {"entity_id": "sensor.trv1"}
+        areas = {
+            "area_a": FakeArea(trv_entities=[shared, {"entity_id": None}]),
+            "area_b": FakeArea(trv_entities=[shared, {"entity_id": "sensor.missing"}]),
+        }
+        hass.states.async_set("sensor.trv1", "40.0", {})
+
+        coordinator._track_trv_entities(areas)
+
+        assert coordinator._trv_values == {
+            "sensor.trv1": (None, 40.0),
+            "sensor.missing": (None, None),
+        }
+
+        hass.states.async_set("sensor.trv1", "10.0", {})
+        await hass.async_block_till_done()
+
+        assert coordinator._trv_values["sensor.trv1"] == (None, 10.0)
+        result = coordinator._get_trv_states_for_area(FakeArea(trv_entities=[shared], state="idle"))
+        assert result[0]["position"] == 10.0
+
+        coordinator._track_trv_entities({})
+
+        assert coordinator._trv_values == {}
+        assert coordinator._unsub_trv_listener is None
+
 
 class TestBuildAreaDataWithWeatherAndTRV:
     """Test _build_area_data with weather and TRV functionality."""
@@ -1664,51 +1310,12 @@ class TestBuildAreaDataWithWeatherAndTRV:
         self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
     ):
         """Test building area data with weather entity."""
-        mock_area = MagicMock()
-        mock_area.name = "Living Room"
-        mock_area.enabled = True
-        mock_area.state = "heat"
-        mock_area.target_temperature = 21.0
-        mock_area.current_temperature = 20.0
-        mock_area.devices = {}
-        mock_area.schedules = {}
-        mock_area.preset_mode = "comfort"
-        mock_area.away_temp = 16.0
-        mock_area.eco_temp = 18.0
-        mock_area.comfort_temp = 21.0
-        mock_area.home_temp = 20.0
-        mock_area.sleep_temp = 17.0
-        mock_area.activity_temp = 22.0
-        mock_area.use_global_away = True
-        mock_area.use_global_eco = True
-        mock_area.use_global_comfort = True
-        mock_area.use_global_home = True
-        mock_area.use_global_sleep = True
-        mock_area.use_global_activity = True
-        mock_area.use_global_presence = True
-        mock_area.boost_manager.boost_mode_active = False
-        mock_area.boost_manager.boost_temp = 23.0
-        mock_area.boost_manager.boost_duration = 60
-        mock_area.hvac_mode = "heat"
-        mock_area.hysteresis_override = None
-        mock_area.manual_override = False
-        mock_area.hidden = False
-        mock_area.shutdown_switches_when_idle = True
-        mock_area.window_sensors = []
-        mock_area.presence_sensors = []
-        mock_area.boost_manager.night_boost_enabled = True
-        mock_area.boost_manager.night_boost_offset = 0.5
-        mock_area.boost_manager.night_boost_start_time = "22:00"
-        mock_area.boost_manager.night_boost_end_time = "06:00"
-        mock_area.boost_manager.smart_boost_enabled = False
-        mock_area.boost_manager.smart_boost_target_time = "06:00"
-        mock_area.boost_manager.weather_entity_id = "weather.home"
-        mock_area.get_effective_target_temperature.return_value = 21.0
+        mock_area = FakeArea(boost_manager=FakeBoostManager(weather_entity_id="weather.home"))
 
         # Set weather state
         hass.states.async_set("weather.home", "15.0", {"temperature": 15.0, "humidity": 70})
 
-        coordinator.area_manager.get_all_areas.return_value = {TEST_AREA_ID: mock_area}
+        install_area(coordinator, mock_area)
 
         data = await coordinator._async_update_data()
 
@@ -1722,52 +1329,12 @@ class TestBuildAreaDataWithWeatherAndTRV:
         self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
     ):
         """Test building area data with TRV entities."""
-        mock_area = MagicMock()
-        mock_area.name = "Living Room"
-        mock_area.enabled = True
-        mock_area.state = "heat"
-        mock_area.target_temperature = 21.0
-        mock_area.current_temperature = 20.0
-        mock_area.devices = {}
-        mock_area.schedules = {}
-        mock_area.preset_mode = "comfort"
-        mock_area.away_temp = 16.0
-        mock_area.eco_temp = 18.0
-        mock_area.comfort_temp = 21.0
-        mock_area.home_temp = 20.0
-        mock_area.sleep_temp = 17.0
-        mock_area.activity_temp = 22.0
-        mock_area.use_global_away = True
-        mock_area.use_global_eco = True
-        mock_area.use_global_comfort = True
-        mock_area.use_global_home = True
-        mock_area.use_global_sleep = True
-        mock_area.use_global_activity = True
-        mock_area.use_global_presence = True
-        mock_area.boost_manager.boost_mode_active = False
-        mock_area.boost_manager.boost_temp = 23.0
-        mock_area.boost_manager.boost_duration = 60
-        mock_area.hvac_mode = "heat"
-        mock_area.hysteresis_override = None
-        mock_area.manual_override = False
-        mock_area.hidden = False
-        mock_area.shutdown_switches_when_idle = True
-        mock_area.window_sensors = []
-        mock_area.presence_sensors = []
-        mock_area.boost_manager.night_boost_enabled = True
-        mock_area.boost_manager.night_boost_offset = 0.5
-        mock_area.boost_manager.night_boost_start_time = "22:00"
-        mock_area.boost_manager.night_boost_end_time = "06:00"
-        mock_area.boost_manager.smart_boost_enabled = False
-        mock_area.boost_manager.smart_boost_target_time = "06:00"
-        mock_area.boost_manager.weather_entity_id = None
-        mock_area.trv_entities = [{"entity_id": "binary_sensor.trv1"}]
-        mock_area.get_effective_target_temperature.return_value = 21.0
+        mock_area = FakeArea(trv_entities=[{"entity_id": "binary_sensor.trv1"}])
 
         # Set TRV state
         hass.states.async_set("binary_sensor.trv1", "on", {})
 
-        coordinator.area_manager.get_all_areas.return_value = {TEST_AREA_ID: mock_area}
+        install_area(coordinator, mock_area)
 
         data = await coordinator._async_update_data()
 
@@ -1776,6 +1343,7 @@ class TestBuildAreaDataWithWeatherAndTRV:
         assert len(area_data["trvs"]) == 1
         assert area_data["trvs"][0]["entity_id"] == "binary_sensor.trv1"
         assert area_data["trvs"][0]["open"] is True
+        assert coordinator._tracked_trv_entities == {"binary_sensor.trv1"}
 
 
 class TestBoilerTemperature:
@@ -1874,17 +1442,13 @@ class TestAsyncSetControlMaxRelativeModulation:
     @pytest.mark.asyncio
     async def test_set_modulation_no_gateway(self, coordinator: SmartHeatingCoordinator):
         """Test setting modulation when no gateway configured."""
-        from homeassistant.exceptions import HomeAssistantError
-
         coordinator.area_manager.opentherm_gateway_id = None
 
         with pytest.raises(HomeAssistantError, match="gateway not configured"):
             await coordinator.async_set_control_max_relative_modulation(50)
 
     @pytest.mark.asyncio
-    async def test_set_modulation_success(
-        self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
-    ):
+    async def test_set_modulation_success(self, coordinator: SmartHeatingCoordinator):
         """Test setting modulation successfully."""
         gateway_id = "opentherm_gw_1"
         coordinator.area_manager.opentherm_gateway_id = gateway_id
@@ -1904,9 +1468,7 @@ class TestAsyncSetControlMaxRelativeModulation:
             )
 
     @pytest.mark.asyncio
-    async def test_set_modulation_zero(
-        self, coordinator: SmartHeatingCoordinator, hass: HomeAssistant
-    ):
+    async def test_set_modulation_zero(self, coordinator: SmartHeatingCoordinator):
         """Test setting modulation to 0% (used in OPV calibration)."""
         gateway_id = "opentherm_gw_1"
         coordinator.area_manager.opentherm_gateway_id = gateway_id
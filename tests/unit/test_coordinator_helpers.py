@@ -45,3 +45,13 @@ async def test_call_maybe_async_async():
 
     val = await call_maybe_async(g, 3, 4)
     assert val == 12
+
+
+@pytest.mark.asyncio
+async def test_call_maybe_async_awaits_awaitable_from_sync_callable():
+    async def g():
+        return "done"
+
+    mock = MagicMock(return_value=g())
+
+    assert await call_maybe_async(mock) == "done"
@@ -9,6 +9,7 @@ from smart_heating.features.device_capability_detector import (
     DeviceCapabilities,
     DeviceCapabilityDetector,
     DeviceProfile,
+    _classify_device,
 )
 
 
@@ -45,7 +46,7 @@ class TestDeviceCapabilities:
             supports_turn_on=True,
             supports_temperature=True,
             supports_position=False,
-            supports_hvac_modes=["heat", "off"],
+            supports_hvac_modes=("heat", "off"),
             min_temp=5.0,
             max_temp=30.0,
             temp_step=0.5,
@@ -87,6 +88,9 @@ class TestDeviceCapabilities:
         assert caps.supports_turn_off is False
         assert caps.device_type == "trv"
         assert caps.optimal_off_temp == 0.0
+        assert caps.supports_hvac_modes == ("heat",)
+        assert caps.to_dict()["supports_hvac_modes"] == ["heat"]
+        assert hash(caps) == hash(DeviceCapabilities.from_dict(data))
 
 
 class TestDeviceProfile:
@@ -99,7 +103,7 @@ class TestDeviceProfile:
             supports_turn_on=True,
             supports_temperature=True,
             supports_position=False,
-            supports_hvac_modes=["heat"],
+            supports_hvac_modes=("heat",),
             min_temp=5.0,
             max_temp=30.0,
             temp_step=0.5,
@@ -187,6 +191,19 @@ class TestDeviceCapabilityDetector:
             == "thermostat"
         )
 
+    def test_detect_device_type_is_memoized(self, detector):
+        """Test classification is cached and matches case-insensitively."""
+        _classify_device.cache_clear()
+        state = MagicMock(spec=State)
+        state.attributes = {"hvac_modes": ["heat", "off"]}
+
+        assert detector._detect_device_type("climate.Bedroom_TRV", state, "zigbee") == "trv"
+        assert detector._detect_device_type("climate.Bedroom_TRV", state, "zigbee") == "trv"
+
+        info = _classify_device.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
     def test_get_optimal_parameters_trv(self, detector):
         """Test getting optimal parameters for TRV."""
         params = detector._get_optimal_parameters("trv")
@@ -267,6 +284,31 @@ class TestDeviceCapabilityDetector:
                 assert cached is not None
                 assert cached.entity_id == "climate.test_trv"
 
+    @pytest.mark.asyncio
+    async def test_discover_and_cache_batch(self, detector, mock_hass):
+        """Test batch discovery fetches registries once and skips missing entities."""
+        state = MagicMock(spec=State)
+        state.attributes = {"supported_features": 1, "hvac_modes": ["heat", "off"]}
+        mock_hass.states.get.side_effect = lambda entity_id: (
+            None if entity_id == "climate.missing" else state
+        )
+
+        with patch("smart_heating.features.device_capability_detector.er.async_get") as mock_er:
+            with patch("smart_heating.features.device_capability_detector.dr.async_get") as mock_dr:
+                mock_er.return_value.async_get.return_value = None
+
+                profiles = await detector.discover_and_cache_batch(
+                    ["climate.bedroom_trv", "climate.missing", "climate.hallway"]
+                )
+
+                mock_er.assert_called_once_with(mock_hass)
+                mock_dr.assert_called_once_with(mock_hass)
+
+        assert list(profiles) == ["climate.bedroom_trv", "climate.hallway"]
+        assert profiles["climate.bedroom_trv"].capabilities.device_type == "trv"
+        assert detector.get_profile("climate.hallway") is profiles["climate.hallway"]
+        assert detector.get_profile("climate.missing") is None
+
     def test_load_profiles(self, detector):
         """Test loading profiles from storage."""
         profiles_data = {
@@ -305,7 +347,7 @@ class TestDeviceCapabilityDetector:
             supports_turn_on=True,
             supports_temperature=True,
             supports_position=False,
-            supports_hvac_modes=["heat"],
+            supports_hvac_modes=("heat",),
             min_temp=5.0,
             max_temp=30.0,
             temp_step=0.5,
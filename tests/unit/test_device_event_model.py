@@ -1,7 +1,10 @@
 """Tests for DeviceEvent model."""
 
+import dataclasses
 import re
 
+import pytest
+from smart_heating.models import device_event
 from smart_heating.models.device_event import DeviceEvent
 
 
@@ -36,3 +39,45 @@ def test_device_event_to_from_dict_roundtrip():
     ev2 = DeviceEvent.from_dict(d)
 
     assert ev2 == ev
+
+
+def test_device_event_now_reuses_timestamp_within_second(monkeypatch):
+    monkeypatch.setattr(device_event.time, "time", lambda: 1735732800.25)
+    ev1 = DeviceEvent.now("a1", "d1", "sent", "cmd", {})
+    monkeypatch.setattr(device_event.time, "time", lambda: 1735732800.75)
+    ev2 = DeviceEvent.now("a1", "d1", "sent", "cmd", {})
+    monkeypatch.setattr(device_event.time, "time", lambda: 1735732801.0)
+    ev3 = DeviceEvent.now("a1", "d1", "sent", "cmd", {})
+
+    assert ev1.timestamp == "2025-01-01T12:00:00Z"
+    assert ev2.timestamp is ev1.timestamp
+    assert ev3.timestamp == "2025-01-01T12:00:01Z"
+
+
+def test_device_event_is_immutable():
+    ev = DeviceEvent.now("a1", "d1", "sent", "cmd", {})
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        ev.status = "error"
+    assert not hasattr(ev, "__dict__")
+
+
+def test_device_event_to_dict_copies_payload():
+    ev = DeviceEvent.now("a1", "d1", "sent", "cmd", {"target": {"temperature": 21.0}})
+
+    d = ev.to_dict()
+    d["payload"]["target"]["temperature"] = 5.0
+
+    assert ev.payload == {"target": {"temperature": 21.0}}
+
+
+def test_device_event_interns_identifiers():
+    ev1 = DeviceEvent.from_dict(
+        {
+            **DeviceEvent.now("a1", "d1", "sent", "cmd", {}).to_dict(),
+            "device_id": "".join(["d", "1"]),
+        }
+    )
+    ev2 = DeviceEvent.now("a1", "".join(["d", "1"]), "sent", "cmd", {})
+
+    assert ev1.device_id is ev2.device_id
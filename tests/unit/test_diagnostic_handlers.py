@@ -2,6 +2,7 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from homeassistant.exceptions import HomeAssistantError
 from smart_heating.services.diagnostic_handlers import async_handle_force_thermostat_update
 
 
@@ -80,3 +81,118 @@ async def test_force_thermostat_update_no_thermostats():
 
     # Should complete without raising
     await async_handle_force_thermostat_update(call, area_manager, coordinator)
+
+
+@pytest.mark.asyncio
+async def test_force_thermostat_update_turns_on_shared_switch_once():
+    hass = MagicMock()
+    state_map = {
+        "switch.unit1_power": MockState("off"),
+        "climate.unit1": MockState("on"),
+        "water_heater.unit1": MockState("on"),
+    }
+    hass.states.get = MagicMock(side_effect=state_map.get)
+
+    async def fake_async_call(domain, service, data, blocking=False):
+        if domain == "switch" and service == "turn_on":
+            state_map[data["entity_id"]] = MockState("on")
+
+    hass.services.async_call = AsyncMock(side_effect=fake_async_call)
+
+    area = MagicMock()
+    area.get_thermostats.return_value = ["climate.unit1", "water_heater.unit1"]
+    area_manager = MagicMock()
+    area_manager.get_area.return_value = area
+    coordinator = MagicMock()
+    coordinator.hass = hass
+    call = SimpleNamespace(data={"area_id": "a1", "temperature": 21.0})
+
+    await async_handle_force_thermostat_update(call, area_manager, coordinator)
+
+    switch_calls = [
+        c for c in hass.services.async_call.await_args_list if c.args[:2] == ("switch", "turn_on")
+    ]
+    assert len(switch_calls) == 1
+    assert hass.services.async_call.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_force_thermostat_update_continues_after_thermostat_error():
+    hass = MagicMock()
+    hass.states.get = MagicMock(return_value=MockState("on"))
+
+    async def fake_async_call(domain, service, data, blocking=False):
+        if data["entity_id"] == "climate.broken":
+            raise HomeAssistantError("unavailable")
+
+    hass.services.async_call = AsyncMock(side_effect=fake_async_call)
+
+    area = MagicMock()
+    area.get_thermostats.return_value = ["climate.broken", "climate.ok"]
+    area_manager = MagicMock()
+    area_manager.get_area.return_value = area
+    coordinator = MagicMock()
+    coordinator.hass = hass
+    call = SimpleNamespace(data={"area_id": "a1", "temperature": 21.0})
+
+    await async_handle_force_thermostat_update(call, area_manager, coordinator)
+
+    hass.services.async_call.assert_any_await(
+        "climate",
+        "set_temperature",
+        {"entity_id": "climate.ok", "temperature": 21.0},
+        blocking=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_force_thermostat_update_skips_thermostat_behind_failed_switch():
+    hass = MagicMock()
+    state_map = {
+        "switch.unit1_power": MockState("off"),
+        "climate.unit1": MockState("on"),
+        "climate.unit2": MockState("on"),
+    }
+    hass.states.get = MagicMock(side_effect=state_map.get)
+
+    async def fake_async_call(domain, service, data, blocking=False):
+        if domain == "switch":
+            raise HomeAssistantError("switch unavailable")
+
+    hass.services.async_call = AsyncMock(side_effect=fake_async_call)
+
+    area = MagicMock()
+    area.get_thermostats.return_value = ["climate.unit1", "climate.unit2"]
+    area_manager = MagicMock()
+    area_manager.get_area.return_value = area
+    coordinator = MagicMock()
+    coordinator.hass = hass
+    call = SimpleNamespace(data={"area_id": "a1", "temperature": 21.0})
+
+    await async_handle_force_thermostat_update(call, area_manager, coordinator)
+
+    climate_targets = [
+        c.args[2]["entity_id"]
+        for c in hass.services.async_call.await_args_list
+        if c.args[0] == "climate"
+    ]
+    assert climate_targets == ["climate.unit2"]
+
+
+@pytest.mark.asyncio
+async def test_force_thermostat_update_reraises_unexpected_switch_error():
+    hass = MagicMock()
+    state_map = {"switch.unit1_power": MockState("off"), "climate.unit1": MockState("on")}
+    hass.states.get = MagicMock(side_effect=state_map.get)
+    hass.services.async_call = AsyncMock(side_effect=TypeError("bad call"))
+
+    area = MagicMock()
+    area.get_thermostats.return_value = ["climate.unit1"]
+    area_manager = MagicMock()
+    area_manager.get_area.return_value = area
+    coordinator = MagicMock()
+    coordinator.hass = hass
+    call = SimpleNamespace(data={"area_id": "a1"})
+
+    with pytest.raises(TypeError):
+        await async_handle_force_thermostat_update(call, area_manager, coordinator)
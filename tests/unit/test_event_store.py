@@ -1,5 +1,6 @@
 """Unit tests for EventStore (JSON-path logic and DB fallback)."""
 
+import random
 from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock
 
@@ -10,14 +11,20 @@ from smart_heating.const import (
     EVENT_STORAGE_DATABASE,
     EVENT_STORAGE_JSON,
 )
-from smart_heating.storage.event_store import EventStore
+from smart_heating.storage.event_store import JSON_SAVE_DELAY, EventStore, _parse_start_time
 
 
-@pytest.mark.asyncio
-async def test_load_from_json_and_cleanup(monkeypatch):
-    hass = MagicMock()
-    store = EventStore(hass, storage_backend=EVENT_STORAGE_JSON)
+@pytest.fixture
+def store() -> EventStore:
+    """Return a JSON-backed EventStore whose saves are mocked."""
+    event_store = EventStore(MagicMock(), storage_backend=EVENT_STORAGE_JSON)
+    event_store._store.async_save = AsyncMock()
+    event_store._store.async_delay_save = MagicMock()
+    return event_store
 
+
+@pytest.mark.asyncio
+async def test_load_from_json_and_cleanup(store):
     # Prepare a mix of old and recent events
     now = dt_util.now()
     old = (now - timedelta(days=EVENT_RETENTION_DAYS + 5)).isoformat()
@@ -50,7 +57,6 @@ async def test_load_from_json_and_cleanup(monkeypatch):
     }
 
     store._store.async_load = AsyncMock(return_value=data)
-    store._store.async_save = AsyncMock()
 
     await store.async_load()
 
@@ -60,12 +66,7 @@ async def test_load_from_json_and_cleanup(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_record_and_get_events_and_count():
-    hass = MagicMock()
-    store = EventStore(hass, storage_backend=EVENT_STORAGE_JSON)
-
-    store._store.async_save = AsyncMock()
-
+async def test_record_and_get_events_and_count(store):
     area = "area_rec"
     now = dt_util.now()
 
@@ -119,10 +120,7 @@ async def test_record_and_get_events_and_count():
 
 
 @pytest.mark.asyncio
-async def test_cleanup_json_removes_older_than_cutoff():
-    hass = MagicMock()
-    store = EventStore(hass)
-
+async def test_cleanup_json_removes_older_than_cutoff(store):
     area = "cleanup_area"
     now = dt_util.now()
 
@@ -146,7 +144,6 @@ async def test_cleanup_json_removes_older_than_cutoff():
     }
 
     store._events[area] = [old, recent]
-    store._store.async_save = AsyncMock()
 
     # Set retention days small and run cleanup
     store._retention_days = 1
@@ -158,17 +155,35 @@ async def test_cleanup_json_removes_older_than_cutoff():
 
 
 @pytest.mark.asyncio
-async def test_close_saves_json_when_json_backend():
-    hass = MagicMock()
-    store = EventStore(hass)
-    store._store.async_save = AsyncMock()
-
+async def test_close_saves_json_when_json_backend(store):
     await store.async_close()
 
     # When backend is JSON, close should call save
     store._store.async_save.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_record_events_coalesce_json_saves_until_close(store):
+    now = dt_util.now()
+    for minutes_ago in range(5):
+        start = (now - timedelta(minutes=minutes_ago)).isoformat()
+        await store.async_record_event("debounce_area", {"start_time": start})
+
+    # Records hand the save to the Store helper, which coalesces them
+    store._store.async_save.assert_not_called()
+    assert store._store.async_delay_save.call_count == 5
+    data_func, delay = store._store.async_delay_save.call_args.args
+    assert delay == JSON_SAVE_DELAY
+    assert len(data_func()["events"]["debounce_area"]) == 5
+
+    await store.async_close()
+
+    # Close writes everything exactly once
+    store._store.async_save.assert_awaited_once()
+    saved = store._store.async_save.call_args.args[0]
+    assert len(saved["events"]["debounce_area"]) == 5
+
+
 @pytest.mark.asyncio
 async def test_record_event_database_fallbacks_to_json_on_db_error(monkeypatch):
     hass = MagicMock()
@@ -202,12 +217,80 @@ async def test_record_event_database_fallbacks_to_json_on_db_error(monkeypatch):
     # _db_table must be set to try DB path
     store._db_table = MagicMock()
 
-    # Should not raise; fallback to JSON should occur
+    # Should not raise; the insert is queued until the batch is flushed
     await store.async_record_event(area, ev)
+    store._store.async_save.assert_not_called()
 
+    # Flushing hits the DB error and falls back to JSON
+    await store._flush_pending_db()
+
+    fake_recorder.async_add_executor_job.assert_awaited_once()
+    assert store._pending_db_events == []
     assert area in store._events
     assert len(store._events[area]) == 1
-    store._store.async_save.assert_called()
+    store._store.async_save.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_flush_timer_handles_failed_json_fallback(monkeypatch):
+    store = EventStore(MagicMock(), storage_backend=EVENT_STORAGE_DATABASE)
+    fake_recorder = MagicMock()
+    fake_recorder.async_add_executor_job = AsyncMock(side_effect=RuntimeError("db error"))
+    monkeypatch.setattr(
+        "smart_heating.storage.event_store.get_instance", lambda hass: fake_recorder
+    )
+    store._store.async_save = AsyncMock(side_effect=OSError("disk full"))
+    store._db_table = MagicMock()
+
+    await store.async_record_event("timer_area", {"start_time": dt_util.now().isoformat()})
+
+    # Both the insert and the JSON fallback fail; the timer must not raise
+    await store._async_flush_timer(dt_util.utcnow())
+
+    store._store.async_save.assert_awaited_once()
+    assert store._pending_db_events == []
+
+
+@pytest.mark.asyncio
+async def test_record_event_database_batches_inserts(monkeypatch):
+    hass = MagicMock()
+    store = EventStore(hass, storage_backend=EVENT_STORAGE_DATABASE)
+
+    fake_recorder = MagicMock()
+    fake_recorder.async_add_executor_job = AsyncMock()
+    monkeypatch.setattr(
+        "smart_heating.storage.event_store.get_instance", lambda hass: fake_recorder
+    )
+    store._db_table = MagicMock()
+    store._store.async_save = AsyncMock()
+
+    now = dt_util.now().isoformat()
+    for i in range(10):
+        await store.async_record_event(
+            "batch_area",
+            {
+                "start_time": now,
+                "end_time": now,
+                "start_temp": 18.0 + i,
+                "end_temp": 19.0 + i,
+                "duration_minutes": 10.0,
+                "temp_change": 1.0,
+                "heating_rate": 0.1,
+            },
+        )
+
+    # Nothing written yet; a single delayed flush is scheduled
+    fake_recorder.async_add_executor_job.assert_not_called()
+    assert len(store._pending_db_events) == 10
+    assert store._flush_unsub is not None
+    assert len(store._events["batch_area"]) == 10
+
+    await store.async_close()
+
+    # All ten events are written with one executor job
+    fake_recorder.async_add_executor_job.assert_awaited_once()
+    assert store._pending_db_events == []
+    assert store._flush_unsub is None
 
 
 @pytest.mark.asyncio
@@ -241,3 +324,155 @@ async def test_deferred_db_validation(monkeypatch):
     assert store._db_validated is True
     # DB table should have been initialized
     assert store._db_table is not None
+
+
+@pytest.mark.asyncio
+async def test_record_event_keeps_events_sorted_by_start_time(store):
+    area = "sorted_area"
+    now = dt_util.now()
+    offsets = [3, 0, 6, 1, 5, 2, 4]
+    for days_ago in offsets:
+        start = (now - timedelta(days=days_ago, minutes=1)).isoformat()
+        await store.async_record_event(
+            area,
+            {
+                "start_time": start,
+                "end_time": start,
+                "start_temp": float(days_ago),
+                "end_temp": float(days_ago) + 1.0,
+                "duration_minutes": 10.0,
+                "temp_change": 1.0,
+                "heating_rate": 0.1,
+            },
+        )
+
+    # Stored oldest first regardless of insertion order
+    assert [e["start_temp"] for e in store._events[area]] == [6.0, 5.0, 4.0, 3.0, 2.0, 1.0, 0.0]
+
+    recent = await store.async_get_events(area, days=2)
+    assert [e["start_temp"] for e in recent] == [1.0, 0.0]
+
+    # Returned lists are copies of the stored events
+    recent.clear()
+    assert len(store._events[area]) == len(offsets)
+
+
+@pytest.mark.asyncio
+async def test_save_to_json_uses_snapshot_of_events(store):
+    event = {"start_time": dt_util.now().isoformat(), "start_temp": 19.0}
+    store._events["snap_area"] = [event]
+
+    await store._async_save_to_json()
+
+    saved = store._store.async_save.call_args.args[0]
+    assert saved["events"] == {"snap_area": [event]}
+    assert saved["retention_days"] == store._retention_days
+    assert saved["storage_backend"] == EVENT_STORAGE_JSON
+
+    # Mutating the store after the save must not touch the saved payload
+    store._events["snap_area"].append({"start_time": event["start_time"]})
+    store._events["other_area"] = []
+    assert saved["events"] == {"snap_area": [event]}
+
+
+@pytest.mark.asyncio
+async def test_start_times_parsed_once_per_event(store):
+    _parse_start_time.cache_clear()
+
+    area = "parse_area"
+    now = dt_util.now()
+    for hours_ago in (30, 10, 20, 1):
+        start = (now - timedelta(hours=hours_ago)).isoformat()
+        await store.async_record_event(area, {"start_time": start, "start_temp": 20.0})
+
+    misses = _parse_start_time.cache_info().misses
+    assert misses == 4
+
+    await store.async_get_events(area, days=1)
+    store._retention_days = 1
+    await store._async_cleanup_old_events()
+
+    # Queries and cleanup reuse the timestamps parsed at record time
+    assert _parse_start_time.cache_info().misses == misses
+    assert len(store._events[area]) == 3
+
+
+@pytest.mark.asyncio
+async def test_record_events_saves_json_once(store):
+    now = dt_util.now()
+    events = [
+        {"start_time": (now - timedelta(hours=h)).isoformat(), "start_temp": float(h)}
+        for h in (2, 5, 1)
+    ]
+
+    await store.async_record_events("multi_area", events)
+    assert [e["start_temp"] for e in store._events["multi_area"]] == [5.0, 2.0, 1.0]
+
+    # An empty batch is a no-op
+    await store.async_record_events("multi_area", [])
+
+    await store.async_close()
+    store._store.async_save.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_final_write_flushes_pending_db_events(store):
+    store._store.async_load = AsyncMock(return_value=None)
+    store._db_validated = True
+
+    await store.async_load()
+    store.hass.bus.async_listen_once.assert_called_once()
+    assert store._final_write_unsub is not None
+
+    store._flush_pending_db = AsyncMock()
+    await store._async_final_write(MagicMock())
+
+    # Delayed JSON saves are written by the Store helper itself
+    store._flush_pending_db.assert_awaited_once()
+    store._store.async_save.assert_not_called()
+    assert store._final_write_unsub is None
+
+
+@pytest.mark.asyncio
+async def test_shuffled_records_query_in_order(store):
+    now = dt_util.now()
+    # One event every 5 minutes over about 3.5 days, recorded in random order
+    minutes = [5 * i for i in range(1000)]
+    random.Random(42).shuffle(minutes)
+    await store.async_record_events(
+        "shuffle_area",
+        [{"start_time": (now - timedelta(minutes=m)).isoformat()} for m in minutes],
+    )
+
+    all_events = await store.async_get_events("shuffle_area", days=None)
+    recent = await store.async_get_events("shuffle_area", days=1)
+
+    starts = [e["start_time"] for e in all_events]
+    assert len(starts) == 1000
+    assert starts == sorted(starts, key=_parse_start_time)
+    recent_starts = [_parse_start_time(e["start_time"]) for e in recent]
+    assert recent_starts == sorted(recent_starts)
+    assert all(start > (now - timedelta(days=1)).timestamp() for start in recent_starts)
+    # Events 0..1435 minutes ago fall inside the last day
+    assert len(recent) == 288
+
+
+@pytest.mark.asyncio
+async def test_event_count_uses_cache_before_database(monkeypatch):
+    store = EventStore(MagicMock(), storage_backend=EVENT_STORAGE_DATABASE)
+    store._db_table = MagicMock()
+
+    fake_recorder = MagicMock()
+    fake_recorder.async_add_executor_job = AsyncMock(return_value=7)
+    monkeypatch.setattr(
+        "smart_heating.storage.event_store.get_instance", lambda hass: fake_recorder
+    )
+
+    store._events["cached_area"] = [{"start_time": "a"}, {"start_time": "b"}]
+
+    assert await store.async_get_event_count("cached_area") == 2
+    fake_recorder.async_add_executor_job.assert_not_called()
+
+    # Areas not in the cache still fall back to a COUNT query
+    assert await store.async_get_event_count("other_area") == 7
+    fake_recorder.async_add_executor_job.assert_awaited_once()
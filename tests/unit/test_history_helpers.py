@@ -1,49 +1,29 @@
 from types import SimpleNamespace
 
 import pytest
+from homeassistant.helpers.json import json_dumps
 from smart_heating.const import HISTORY_STORAGE_DATABASE
-from smart_heating.storage.history import HistoryTracker
+from smart_heating.storage.history import DB_STATS_CACHE_TTL, HistoryTracker, _normalize_state
 
+from tests.unit.fakes import FakeStore
 
-@pytest.mark.asyncio
-async def test_async_get_database_stats_disabled_by_default(monkeypatch):
-    hass = SimpleNamespace()
-
-    # Provide minimal Store replacement to avoid HA internal store access
-    class FakeStore:
-        def __init__(self, hass, v, key):
-            self._data = None
-
-        async def async_load(self):
-            return self._data
-
-        async def async_save(self, data):
-            self._data = data
 
+@pytest.fixture
+def tracker(monkeypatch):
+    """History tracker backed by FakeStore instead of the real Store."""
     monkeypatch.setattr("smart_heating.storage.history.Store", FakeStore)
-    tracker = HistoryTracker(hass)
+    return HistoryTracker(SimpleNamespace())
+
 
+@pytest.mark.asyncio
+async def test_async_get_database_stats_disabled_by_default(tracker):
     res = await tracker.async_get_database_stats()
     assert res["enabled"] is False
     assert "not enabled" in res["message"]
 
 
 @pytest.mark.asyncio
-async def test_async_get_database_stats_enabled(monkeypatch):
-    hass = SimpleNamespace()
-
-    class FakeStore:
-        def __init__(self, hass, v, key):
-            self._data = None
-
-        async def async_load(self):
-            return self._data
-
-        async def async_save(self, data):
-            self._data = data
-
-    monkeypatch.setattr("smart_heating.storage.history.Store", FakeStore)
-    tracker = HistoryTracker(hass)
+async def test_async_get_database_stats_enabled(tracker, monkeypatch):
     # enable DB backend and set dummy table
     tracker._storage_backend = HISTORY_STORAGE_DATABASE
     # Use a real Table object to make SQLAlchemy happy
@@ -87,21 +67,33 @@ async def test_async_get_database_stats_enabled(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_async_get_database_stats_handles_no_engine(monkeypatch):
-    hass = SimpleNamespace()
+async def test_async_get_database_stats_reuses_recent_count(tracker, monkeypatch):
+    tracker._storage_backend = HISTORY_STORAGE_DATABASE
+    tracker._db_table = object()
 
-    class FakeStore:
-        def __init__(self, hass, v, key):
-            self._data = None
+    jobs = []
 
-        async def async_load(self):
-            return self._data
+    async def _run(fn):
+        jobs.append(fn)
+        return {"enabled": True, "total_entries": len(jobs)}
 
-        async def async_save(self, data):
-            self._data = data
+    recorder = SimpleNamespace(engine=object(), async_add_executor_job=_run)
+    monkeypatch.setattr("smart_heating.storage.history.get_instance", lambda hass_arg: recorder)
 
-    monkeypatch.setattr("smart_heating.storage.history.Store", FakeStore)
-    tracker = HistoryTracker(hass)
+    first = await tracker.async_get_database_stats()
+    second = await tracker.async_get_database_stats()
+    assert first == second == {"enabled": True, "total_entries": 1}
+    assert len(jobs) == 1
+
+    # Once the cached count expires the next call queries again
+    cached_at, stats = tracker._stats_cache
+    tracker._stats_cache = (cached_at - DB_STATS_CACHE_TTL, stats)
+    third = await tracker.async_get_database_stats()
+    assert third["total_entries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_async_get_database_stats_handles_no_engine(tracker, monkeypatch):
     tracker._storage_backend = HISTORY_STORAGE_DATABASE
     # Use a real Table object to make SQLAlchemy happy
     from sqlalchemy import Column, Integer, MetaData, Table
@@ -115,3 +107,18 @@ async def test_async_get_database_stats_handles_no_engine(monkeypatch):
     res = await tracker.async_get_database_stats()
     assert res["enabled"] is False
     assert "Recorder engine" in res["message"] or "not initialized" in res["message"]
+
+
+def test_parse_trv_json_round_trip_and_invalid(tracker):
+    trvs = [{"entity_id": "sensor.trv_1", "open": True, "position": 42.5}]
+    assert tracker._parse_trv_json(json_dumps(trvs)) == trvs
+    assert tracker._parse_trv_json("") is None
+    assert tracker._parse_trv_json("{not json") is None
+
+
+def test_normalize_state_known_unknown_and_non_string():
+    assert _normalize_state("HEATING") == "heating"
+    assert _normalize_state("Idle") == "idle"
+    assert _normalize_state("heating") == "heating"
+    assert _normalize_state("PreHeat") == "preheat"
+    assert _normalize_state(None) is None
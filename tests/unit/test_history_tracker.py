@@ -8,7 +8,7 @@ from smart_heating.const import (
     HISTORY_STORAGE_JSON,
     MAX_HISTORY_RETENTION_DAYS,
 )
-from smart_heating.storage.history import HistoryTracker
+from smart_heating.storage.history import DB_PURGE_BATCH_SIZE, JSON_SAVE_DELAY, HistoryTracker
 
 
 @pytest.mark.asyncio
@@ -76,6 +76,45 @@ async def test_history_database_cleanup_and_save(monkeypatch):
     fake_recorder.async_add_executor_job.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_history_database_cleanup_runs_batches_until_drained(monkeypatch):
+    hass = MagicMock()
+    tracker = HistoryTracker(hass, storage_backend=HISTORY_STORAGE_DATABASE)
+
+    # Two full batches, then a partial one ends the cleanup
+    fake_recorder = MagicMock()
+    fake_recorder.async_add_executor_job = AsyncMock(
+        side_effect=[DB_PURGE_BATCH_SIZE, DB_PURGE_BATCH_SIZE, 3]
+    )
+    monkeypatch.setattr("smart_heating.storage.history.get_instance", lambda hass: fake_recorder)
+
+    tracker._db_table = MagicMock()
+    tracker._async_load_from_database = AsyncMock(return_value=None)
+
+    await tracker._async_cleanup_database()
+
+    assert fake_recorder.async_add_executor_job.await_count == 3
+    tracker._async_load_from_database.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_json_records_use_store_delayed_save():
+    hass = MagicMock()
+    tracker = HistoryTracker(hass, storage_backend=HISTORY_STORAGE_JSON)
+    tracker._store.async_save = AsyncMock()
+    tracker._store.async_delay_save = MagicMock()
+
+    for area in ("a", "b", "c"):
+        await tracker.async_record_temperature(area, 20.0, 21.0, "heating")
+
+    # The Store helper coalesces the writes; nothing is saved directly
+    tracker._store.async_save.assert_not_awaited()
+    assert tracker._store.async_delay_save.call_count == 3
+    data_func, delay = tracker._store.async_delay_save.call_args[0]
+    assert delay == JSON_SAVE_DELAY
+    assert set(data_func()["history"]) == {"a", "b", "c"}
+
+
 @pytest.mark.asyncio
 async def test_set_retention_days_valid_and_invalid():
     hass = MagicMock()
@@ -101,6 +140,7 @@ async def test_set_retention_days_valid_and_invalid():
 async def test_record_temperature_limits_and_get_all_history():
     hass = MagicMock()
     tracker = HistoryTracker(hass)
+    tracker._store.async_delay_save = MagicMock()
 
     area = "area_limit_test"
 
@@ -120,7 +160,7 @@ async def test_record_temperature_limits_and_get_all_history():
     assert isinstance(all_hist, dict)
 
 
-def test_get_history_filters_and_state_normalization():
+def test_get_history_filters():
     hass = MagicMock()
     tracker = HistoryTracker(hass)
 
@@ -163,9 +203,63 @@ def test_get_history_filters_and_state_normalization():
     assert len(res_range) == 1
     assert res_range[0]["current_temperature"] == 18.0
 
-    # ensure state values normalized to lowercase on return
-    out = tracker.get_history(area)
-    assert all(entry["state"].islower() for entry in out)
+
+@pytest.mark.asyncio
+async def test_states_are_normalized_when_stored():
+    hass = MagicMock()
+    tracker = HistoryTracker(hass, storage_backend=HISTORY_STORAGE_JSON)
+
+    stored = {
+        "timestamp": (datetime.now() - timedelta(minutes=5)).isoformat(),
+        "current_temperature": 19.0,
+        "target_temperature": 20.0,
+        "state": "IDLE",
+    }
+    tracker._store.async_load = AsyncMock(return_value={"history": {"area1": [stored]}})
+    await tracker.async_load()
+    # The stored file is read once and shared by the load steps
+    tracker._store.async_load.assert_awaited_once()
+
+    await tracker.async_record_temperature("area1", 20.0, 21.0, "HEATING")
+
+    assert [e["state"] for e in tracker.get_history("area1")] == ["idle", "heating"]
+
+
+@pytest.mark.asyncio
+async def test_range_queries_handle_out_of_order_entries():
+    hass = MagicMock()
+    tracker = HistoryTracker(hass, storage_backend=HISTORY_STORAGE_JSON)
+
+    # Naive local timestamps run backwards when clocks fall back at DST
+    now = datetime.now()
+    stamps = [now - timedelta(hours=h) for h in (1, 3, 2, 4)]
+    entries = [
+        {
+            "timestamp": ts.isoformat(),
+            "current_temperature": 20.0,
+            "target_temperature": 21.0,
+            "state": "idle",
+        }
+        for ts in stamps
+    ]
+    tracker._store.async_load = AsyncMock(return_value={"history": {"area1": entries}})
+
+    await tracker.async_load()
+
+    # Range bounds are inclusive on both ends, regardless of entry order
+    result = tracker.get_history(
+        "area1", start_time=now - timedelta(hours=3), end_time=now - timedelta(hours=2)
+    )
+    assert [e["timestamp"] for e in result] == [
+        (now - timedelta(hours=3)).isoformat(),
+        (now - timedelta(hours=2)).isoformat(),
+    ]
+
+    result = tracker.get_history("area1", hours=2.5)
+    assert [e["timestamp"] for e in result] == [
+        (now - timedelta(hours=1)).isoformat(),
+        (now - timedelta(hours=2)).isoformat(),
+    ]
 
 
 @pytest.mark.asyncio
@@ -22,6 +22,8 @@ async def test_async_record_temperature_includes_trvs():
     hass.config.config_dir = "/tmp"
 
     ht = HistoryTracker(hass, storage_backend="json")
+    # Keep the delayed JSON save from scheduling a real write
+    ht._store.async_delay_save = MagicMock()
 
     mock_recorder = MagicMock()
     mock_recorder.engine = None  # No DB engine
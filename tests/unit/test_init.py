@@ -275,6 +275,7 @@ class TestIntegrationSetup:
             "climate_unsub": MagicMock(),
             "schedule_executor": MagicMock(async_stop=AsyncMock()),
             "history": MagicMock(async_unload=AsyncMock()),
+            "event_store": MagicMock(async_close=AsyncMock()),
         }
 
         with (
@@ -297,6 +298,7 @@ class TestIntegrationSetup:
             hass.data[DOMAIN]["climate_unsub"].assert_called_once()
             hass.data[DOMAIN]["schedule_executor"].async_stop.assert_called_once()
             hass.data[DOMAIN]["history"].async_unload.assert_called_once()
+            hass.data[DOMAIN]["event_store"].async_close.assert_awaited_once()
 
             # Verify coordinator was removed from hass.data
             assert mock_config_entry.entry_id not in hass.data[DOMAIN]
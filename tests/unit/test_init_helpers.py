@@ -94,6 +94,7 @@ async def test_climate_controller_heating_paths(monkeypatch):
     fake_history = MagicMock()
     fake_history.async_save = AsyncMock()
     fake_history.async_record_temperature = AsyncMock()
+    fake_history.async_record_temperatures = AsyncMock()
     fake_cycle.async_prepare_heating_cycle = AsyncMock(return_value=(True, fake_history))
     fake_cycle.async_handle_heating_required = AsyncMock(return_value=(["heating"], 22.0))
     fake_cycle.async_handle_cooling_required = AsyncMock(return_value=None)
@@ -120,3 +121,8 @@ async def test_climate_controller_heating_paths(monkeypatch):
     # Ensure cycle handler prepare called and opentherm gateway control called
     fake_cycle.async_prepare_heating_cycle.assert_called_once()
     controller.device_handler.async_control_opentherm_gateway.assert_called_once()
+
+    # Every area with a temperature is recorded in a single batch
+    fake_history.async_record_temperatures.assert_awaited_once()
+    readings = fake_history.async_record_temperatures.await_args[0][0]
+    assert [r[0] for r in readings] == [aid for aid in areas if aid != "notemp"]
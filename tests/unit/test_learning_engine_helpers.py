@@ -1,17 +1,31 @@
 """Tests for LearningEngine helper functions and branches."""
 
 from datetime import timedelta
+from itertools import chain, repeat
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from homeassistant.util import dt as dt_util
 from smart_heating.features.learning_engine import LearningEngine
 
+from tests.unit.fakes import RATES_INSUFFICIENT, RATES_NEGLIGIBLE, RATES_SUFFICIENT, fake_hass
+
+pytestmark = pytest.mark.usefixtures("no_sleep")
+
+
+def _async_return(value):
+    """Build a coroutine function that always returns ``value``."""
+
+    async def _return(*_args, **_kwargs):
+        return value
+
+    return _return
+
 
 @pytest.mark.asyncio
 async def test_calculate_outdoor_adjustment():
-    hass = MagicMock()
-    le = LearningEngine(hass, MagicMock())
+    le = LearningEngine(fake_hass(), MagicMock())
 
     assert await le._async_calculate_outdoor_adjustment(20) == pytest.approx(1.1)
     assert await le._async_calculate_outdoor_adjustment(10) == pytest.approx(1.0)
@@ -21,8 +35,7 @@ async def test_calculate_outdoor_adjustment():
 
 @pytest.mark.asyncio
 async def test_get_outdoor_delegates(monkeypatch):
-    hass = MagicMock()
-    le = LearningEngine(hass, MagicMock())
+    le = LearningEngine(fake_hass(), MagicMock())
 
     # Patch the helper function to return a known value
     monkeypatch.setattr(
@@ -36,13 +49,12 @@ async def test_get_outdoor_delegates(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_async_get_recent_heating_rates_filters():
-    hass = MagicMock()
     mock_store = MagicMock()
-    le = LearningEngine(hass, mock_store)
+    le = LearningEngine(fake_hass(), mock_store)
 
     # Include some events with heating_rate <= 0 which should be filtered out
-    mock_store.async_get_events = AsyncMock(
-        return_value=[
+    mock_store.async_get_events = _async_return(
+        [
             {"heating_rate": 0.2},
             {"heating_rate": -0.1},
             {"heating_rate": 0},
@@ -56,14 +68,11 @@ async def test_async_get_recent_heating_rates_filters():
 
 @pytest.mark.asyncio
 async def test_async_predict_heating_time_with_adjustment(monkeypatch):
-    hass = MagicMock()
-    le = LearningEngine(hass, MagicMock())
+    le = LearningEngine(fake_hass(), MagicMock())
 
-    # Prepare enough mock heating rates
-    rates = [0.2] * 30
-    le._async_get_recent_heating_rates = AsyncMock(return_value=rates)
-    le._async_get_outdoor_temperature = AsyncMock(return_value=5.0)
-    le._async_calculate_outdoor_adjustment = AsyncMock(return_value=1.0)
+    le._async_get_recent_heating_rates = _async_return(RATES_SUFFICIENT)
+    le._async_get_outdoor_temperature = _async_return(5.0)
+    le._async_calculate_outdoor_adjustment = _async_return(1.0)
 
     minutes = await le.async_predict_heating_time("a1", 18.0, 21.0)
     assert isinstance(minutes, int)
@@ -74,12 +83,10 @@ async def test_async_predict_heating_time_with_adjustment(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_predict_heating_time_with_non_positive_change():
-    hass = MagicMock()
-    le = LearningEngine(hass, MagicMock())
+    le = LearningEngine(fake_hass(), MagicMock())
 
-    rates = [0.2] * 30
-    le._async_get_recent_heating_rates = AsyncMock(return_value=rates)
-    le._async_get_outdoor_temperature = AsyncMock(return_value=None)
+    le._async_get_recent_heating_rates = _async_return(RATES_SUFFICIENT)
+    le._async_get_outdoor_temperature = _async_return(None)
 
     # current_temp >= target_temp should return 0
     minutes = await le.async_predict_heating_time("a1", 22.0, 20.0)
@@ -88,23 +95,20 @@ async def test_predict_heating_time_with_non_positive_change():
 
 @pytest.mark.asyncio
 async def test_calculate_smart_boost_offset_insufficient():
-    hass = MagicMock()
-    le = LearningEngine(hass, MagicMock())
+    le = LearningEngine(fake_hass(), MagicMock())
 
-    le._async_get_recent_heating_rates = AsyncMock(return_value=[0.1] * 5)
+    le._async_get_recent_heating_rates = _async_return(RATES_INSUFFICIENT)
     res = await le.async_calculate_smart_boost_offset("a1")
     assert res is None
 
 
 @pytest.mark.asyncio
 async def test_calculate_smart_boost_offset_returns_value(monkeypatch):
-    hass = MagicMock()
-    le = LearningEngine(hass, MagicMock())
+    le = LearningEngine(fake_hass(), MagicMock())
 
-    # Provide sufficient heating rate samples
-    le._async_get_recent_heating_rates = AsyncMock(return_value=[0.2] * 30)
+    le._async_get_recent_heating_rates = _async_return(RATES_SUFFICIENT)
     # Simulate a cold outdoor temperature to increase boost
-    le._async_get_outdoor_temperature = AsyncMock(return_value=0.0)
+    le._async_get_outdoor_temperature = _async_return(0.0)
 
     res = await le.async_calculate_smart_boost_offset("a1")
     assert res is not None
@@ -113,12 +117,11 @@ async def test_calculate_smart_boost_offset_returns_value(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_calculate_smart_boost_offset_negligible():
-    hass = MagicMock()
-    le = LearningEngine(hass, MagicMock())
+    le = LearningEngine(fake_hass(), MagicMock())
 
-    # Provide many very small heating rates so that computed boost is negligible
-    le._async_get_recent_heating_rates = AsyncMock(return_value=[0.0001] * 30)
-    le._async_get_outdoor_temperature = AsyncMock(return_value=25.0)
+    # Very small heating rates so that the computed boost is negligible
+    le._async_get_recent_heating_rates = _async_return(RATES_NEGLIGIBLE)
+    le._async_get_outdoor_temperature = _async_return(25.0)
 
     res = await le.async_calculate_smart_boost_offset("a1")
     assert res is None
@@ -126,9 +129,8 @@ async def test_calculate_smart_boost_offset_negligible():
 
 @pytest.mark.asyncio
 async def test_async_get_learning_stats_returns_data():
-    hass = MagicMock()
     mock_store = MagicMock()
-    le = LearningEngine(hass, mock_store)
+    le = LearningEngine(fake_hass(), mock_store)
 
     events = [
         {"start_time": "2025-01-01T00:00:00", "heating_rate": 0.2},
@@ -136,7 +138,7 @@ async def test_async_get_learning_stats_returns_data():
     ]
 
     mock_store.async_get_events = AsyncMock(side_effect=[events, events])
-    mock_store.async_get_event_count = AsyncMock(return_value=2)
+    mock_store.async_get_event_count = _async_return(2)
 
     res = await le.async_get_learning_stats("a1")
     assert res["data_points"] == 2
@@ -147,12 +149,11 @@ async def test_async_get_learning_stats_returns_data():
 
 @pytest.mark.asyncio
 async def test_async_get_learning_stats_no_events():
-    hass = MagicMock()
     mock_store = MagicMock()
-    le = LearningEngine(hass, mock_store)
+    le = LearningEngine(fake_hass(), mock_store)
 
-    mock_store.async_get_events = AsyncMock(return_value=[])
-    mock_store.async_get_event_count = AsyncMock(return_value=0)
+    mock_store.async_get_events = _async_return([])
+    mock_store.async_get_event_count = _async_return(0)
 
     res = await le.async_get_learning_stats("a1")
     assert res["data_points"] == 0
@@ -164,10 +165,9 @@ async def test_async_get_learning_stats_no_events():
 
 @pytest.mark.asyncio
 async def test_start_end_heating_event_skip_and_record(monkeypatch):
-    hass = MagicMock()
     mock_store = MagicMock()
     mock_store.async_record_event = AsyncMock()
-    le = LearningEngine(hass, mock_store)
+    le = LearningEngine(fake_hass(), mock_store)
 
     # Start an event with current temp
     await le.async_start_heating_event("room1", 18.0)
@@ -186,49 +186,22 @@ async def test_start_end_heating_event_skip_and_record(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_retry_weather_detection_fails(monkeypatch):
+async def test_retry_weather_detection_fails():
     """Ensure retry loop completes and keeps weather entity None when not found."""
-    hass = MagicMock()
-    hass.states.async_entity_ids.return_value = []
-    le = LearningEngine(hass, MagicMock())
-
-    async def _no_sleep(_):
-        return
-
-    monkeypatch.setattr("asyncio.sleep", _no_sleep)
+    le = LearningEngine(fake_hass(), MagicMock())
 
     await le._async_retry_weather_detection()
     assert le._weather_entity is None
 
 
 @pytest.mark.asyncio
-async def test_retry_weather_detection_succeeds_after_delay(monkeypatch):
+async def test_retry_weather_detection_succeeds_after_delay():
     """Weather entity detected on a retry attempt (not first)."""
-    hass = MagicMock()
-    le = LearningEngine(hass, MagicMock())
-
-    # Simulate entity present in list
-    hass.states.async_entity_ids.return_value = ["weather.home"]
-
-    # First call returns None, second returns a state with temperature
-    weather_state = MagicMock()
-    weather_state.attributes = {"temperature": 9.5}
-
-    def get_side_effect(entity_id):
-        # first time None, afterwards return the weather_state
-        if not hasattr(get_side_effect, "calls"):
-            get_side_effect.calls = 0
-        get_side_effect.calls += 1
-        if get_side_effect.calls == 1:
-            return None
-        return weather_state
-
-    hass.states.get = MagicMock(side_effect=get_side_effect)
-
-    async def _no_sleep(_):
-        return
+    weather_state = SimpleNamespace(state="sunny", attributes={"temperature": 9.5})
+    # First lookup finds nothing, later ones return the weather state
+    lookups = chain([None], repeat(weather_state))
 
-    monkeypatch.setattr("asyncio.sleep", _no_sleep)
+    le = LearningEngine(fake_hass(["weather.home"], lambda _entity_id: next(lookups)), MagicMock())
 
     await le._async_retry_weather_detection()
     assert le._weather_entity == "weather.home"
@@ -7,40 +7,32 @@ import pytest
 from smart_heating import storage_helpers
 from smart_heating.const import DOMAIN
 
-
-class FakeStore:
-    def __init__(self, hass, version, key):
-        self.hass = hass
-        self.version = version
-        self.key = key
-
-    async def async_remove(self):
-        if self.key == "bad_key":
-            raise RuntimeError("boom")
-        # simulate async work
-        await asyncio.sleep(0)
+from tests.unit.fakes import FakeStore
 
 
 @pytest.mark.asyncio
 async def test_async_remove_store_keys_handles_exceptions(monkeypatch):
-    removed = []
-
-    async def fake_remove(self):
-        if self.key == "bad_key":
-            raise RuntimeError("fail")
-        removed.append(self.key)
-
-    monkeypatch.setattr(
-        storage_helpers,
-        "Store",
-        lambda hass, v, k: SimpleNamespace(
-            async_remove=fake_remove.__get__(SimpleNamespace(key=k), object), key=k
-        ),
-    )
+    class FailingStore(FakeStore):
+        async def async_remove(self):
+            if self.key == "bad_key":
+                raise RuntimeError("fail")
+            await super().async_remove()
+
+    stores = []
+
+    def _make_store(*args):
+        stores.append(FailingStore(*args))
+        return stores[-1]
+
+    monkeypatch.setattr(storage_helpers, "Store", _make_store)
 
     hass = Mock()
     # Should not raise even when one key fails
     await storage_helpers._async_remove_store_keys(hass, ["good_key", "bad_key"])
+    assert [(store.key, store.removed) for store in stores] == [
+        ("good_key", True),
+        ("bad_key", False),
+    ]
 
 
 def test_remove_path_removes_and_handles_not_found(tmp_path, monkeypatch):
@@ -185,7 +177,6 @@ def test_async_drop_recorder_tables_skips_invalid_names(monkeypatch):
     hass.async_add_executor_job = lambda fn, *a, **k: _run(fn, *a, **k)
 
     # include invalid names which should be skipped
-    import asyncio
 
     asyncio.get_event_loop().run_until_complete(
         storage_helpers._async_drop_recorder_tables(